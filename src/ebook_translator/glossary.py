@@ -16,8 +16,59 @@ Utilisé à la fois pour :
 import json
 import re
 from pathlib import Path
-from typing import Optional
-from collections import defaultdict
+from typing import Iterable, Optional
+from collections import Counter, defaultdict
+
+
+class _TranslationCounts(Counter):
+    """
+    Compteurs {traduction: count} d'un terme source, avec total maintenu.
+
+    `occurrences` est tenu à jour par toutes les mutations (affectation,
+    suppression, pop, update, clear...), ce qui évite de recalculer
+    sum(values()) dans les filtres et le calcul de confiance. copy(), deepcopy
+    et pickle reconstruisent l'objet via le constructeur (voir Counter), donc
+    le total est recalculé.
+    """
+
+    __slots__ = ("occurrences",)
+
+    def __init__(self, iterable=None, /, **kwds) -> None:
+        self.occurrences = 0
+        super().__init__(iterable, **kwds)
+
+    def __setitem__(self, translation: str, count: int) -> None:
+        self.occurrences += count - self.get(translation, 0)
+        super().__setitem__(translation, count)
+
+    def __delitem__(self, translation: str) -> None:
+        self.occurrences -= self.get(translation, 0)
+        super().__delitem__(translation)
+
+    def update(self, iterable=None, /, **kwds) -> None:
+        # Counter.update() passe par dict.update() quand le compteur est vide,
+        # ce qui contournerait __setitem__
+        for translation, count in Counter(iterable, **kwds).items():
+            self[translation] += count
+
+    def pop(self, translation: str, *default):
+        if translation in self:
+            self.occurrences -= self[translation]
+        return super().pop(translation, *default)
+
+    def popitem(self) -> tuple[str, int]:
+        translation, count = super().popitem()
+        self.occurrences -= count
+        return translation, count
+
+    def setdefault(self, translation: str, default: int = 0) -> int:
+        if translation not in self:
+            self[translation] = default
+        return self[translation]
+
+    def clear(self) -> None:
+        super().clear()
+        self.occurrences = 0
 
 
 class Glossary:
@@ -29,6 +80,7 @@ class Glossary:
 
     Features:
     - learn(): Apprentissage terme par terme
+    - learn_many(): Apprentissage par lot de paires (source, traduction)
     - learn_pair(): Apprentissage depuis textes complets avec extraction auto
     - get_translation(): Récupération avec seuil de confiance
     - export_for_prompt(): Export formaté pour prompts LLM
@@ -49,6 +101,8 @@ class Glossary:
         >>> # 'Matrix → Matrice, Sakamoto → Sakamoto'
     """
 
+    __slots__ = ("cache_path", "_glossary", "_validated", "_conflicts")
+
     def __init__(self, cache_path: Optional[Path] = None):
         """
         Initialise le glossaire.
@@ -57,12 +111,14 @@ class Glossary:
             cache_path: Chemin optionnel pour sauvegarder/charger le glossaire
         """
         self.cache_path = cache_path
-        # {terme_source: {traduction: count}}
-        self._glossary: dict[str, dict[str, int]] = defaultdict(
-            lambda: defaultdict(int)
+        # {terme_source: {traduction: count}} (+ total par terme)
+        self._glossary: dict[str, _TranslationCounts] = defaultdict(
+            _TranslationCounts
         )
         # {terme_source: traduction_validée}
         self._validated: dict[str, str] = {}
+        # Cache de get_conflicts() (None = à recalculer)
+        self._conflicts: Optional[dict[str, list[str]]] = None
 
         if cache_path and cache_path.exists():
             self._load_from_cache()
@@ -100,6 +156,40 @@ class Glossary:
 
         # Incrémenter le compteur
         self._glossary[source_term][translated_term] += 1
+        self._invalidate_conflicts()
+
+    def learn_many(self, pairs: Iterable[tuple[str, str]]) -> int:
+        """
+        Enregistre un lot de traductions observées.
+
+        Équivalent à appeler learn() pour chaque paire, mais sans le coût
+        d'appel de méthode ni les lookups d'attributs répétés par paire.
+
+        Args:
+            pairs: Paires (terme_source, traduction_observée)
+
+        Returns:
+            Nombre de paires enregistrées (hors paires filtrées)
+
+        Example:
+            >>> glossary.learn_many([("Matrix", "Matrice"), ("the", "le")])
+            1
+        """
+        from .glossary_filters import should_exclude_from_glossary
+
+        exclude = should_exclude_from_glossary
+        glossary = self._glossary
+        learned = 0
+
+        for source_term, translated_term in pairs:
+            if exclude(source_term):
+                continue
+            glossary[source_term][translated_term] += 1
+            learned += 1
+
+        if learned:
+            self._invalidate_conflicts()
+        return learned
 
     def get_translation(
         self,
@@ -138,7 +228,7 @@ class Glossary:
             return None
 
         # Trouver la traduction la plus fréquente
-        total = sum(translations.values())
+        total = translations.occurrences
         most_frequent = max(translations, key=translations.get)  # type: ignore
         frequency = translations[most_frequent]
         confidence = frequency / total
@@ -168,6 +258,7 @@ class Glossary:
             >>> # Cette traduction sera toujours utilisée
         """
         self._validated[source_term] = validated_translation
+        self._invalidate_conflicts()
 
     # =========================================================================
     # API avancée : Apprentissage depuis paires complètes
@@ -196,19 +287,22 @@ class Glossary:
         translated_terms = self._extract_terms(translated_text)
 
         # Alignement simple : chercher les correspondances
+        pairs: list[tuple[str, str]] = []
         for original_term in original_terms:
             # Chercher le terme original dans le texte traduit
             # (peut être gardé tel quel, ex: noms propres)
             if original_term in translated_text:
                 # Terme gardé identique
-                self.learn(original_term, original_term)
+                pairs.append((original_term, original_term))
             else:
                 # Chercher la meilleure correspondance par similarité
                 best_match = self._find_best_match(
                     original_term, translated_terms, original_text, translated_text
                 )
                 if best_match:
-                    self.learn(original_term, best_match)
+                    pairs.append((original_term, best_match))
+
+        self.learn_many(pairs)
 
     def _extract_terms(self, text: str) -> list[str]:
         """
@@ -360,7 +454,7 @@ class Glossary:
         # Trier par fréquence (termes les plus utilisés en premier)
         for source_term in sorted(
             self._glossary.keys(),
-            key=lambda t: sum(self._glossary[t].values()),
+            key=lambda t: self._glossary[t].occurrences,
             reverse=True,
         ):
             translation = self.get_translation(
@@ -381,6 +475,10 @@ class Glossary:
         Retourne les termes qui ont plusieurs traductions fréquentes
         (aucune ne domine à >70%).
 
+        Le résultat est mis en cache et invalidé par learn(), learn_many(),
+        validate_translation() et les méthodes de nettoyage. Toute écriture
+        directe dans _glossary doit appeler _invalidate_conflicts().
+
         Returns:
             Dictionnaire {terme: [traductions_conflictuelles]}
 
@@ -388,6 +486,19 @@ class Glossary:
             >>> conflicts = glossary.get_conflicts()
             >>> # {'Matrix': ['Matrice', 'Système']} si traductions équilibrées
         """
+        if self._conflicts is None:
+            self._conflicts = self._compute_conflicts()
+
+        # Copie du dict et des listes : l'appelant peut modifier le résultat
+        # sans corrompre le cache
+        return {term: list(translations) for term, translations in self._conflicts.items()}
+
+    def _invalidate_conflicts(self) -> None:
+        """Force le recalcul des conflits au prochain get_conflicts()."""
+        self._conflicts = None
+
+    def _compute_conflicts(self) -> dict[str, list[str]]:
+        """Parcourt le glossaire pour détecter les conflits (voir get_conflicts)."""
         conflicts: dict[str, list[str]] = {}
 
         for source_term, translations in self._glossary.items():
@@ -400,7 +511,7 @@ class Glossary:
                 continue
 
             # Calculer les ratios
-            total = sum(translations.values())
+            total = translations.occurrences
             max_frequency = max(translations.values())
             dominant_ratio = max_frequency / total
 
@@ -470,6 +581,10 @@ class Glossary:
         """
         Retourne le nombre de termes dans le glossaire.
 
+        O(1) : len() d'un dict est stocké par CPython, aucun compteur
+        parallèle n'est nécessaire (et il divergerait des écritures
+        directes dans _glossary).
+
         Returns:
             Nombre de termes uniques
         """
@@ -487,7 +602,7 @@ class Glossary:
             >>> print(f"Termes: {stats['total_terms']}, Conflits: {stats['conflicting_terms']}")
         """
         return {
-            "total_terms": len(self._glossary),
+            "total_terms": self.get_term_count(),
             "validated_terms": len(self._validated),
             "conflicting_terms": len(self.get_conflicts()),
             "unique_translations": sum(
@@ -516,18 +631,36 @@ class Glossary:
         from .glossary_filters import should_exclude_from_glossary
 
         terms_to_remove = [
-            term
-            for term in self._glossary.keys()
-            if should_exclude_from_glossary(term)
+            term for term in self._glossary if should_exclude_from_glossary(term)
         ]
 
-        for term in terms_to_remove:
-            del self._glossary[term]
+        return self._remove_terms(terms_to_remove)
+
+    def _remove_terms(self, terms: list[str]) -> int:
+        """
+        Supprime un lot de termes du glossaire et des validations.
+
+        La liste est calculée avant toute mutation : on ne modifie jamais
+        _glossary pendant son itération.
+
+        Args:
+            terms: Termes à supprimer
+
+        Returns:
+            Nombre de termes supprimés
+        """
+        if terms:
+            self._invalidate_conflicts()
+
+        glossary_pop = self._glossary.pop
+        validated_pop = self._validated.pop
+
+        for term in terms:
+            glossary_pop(term, None)
             # Supprimer aussi des validations si présent
-            if term in self._validated:
-                del self._validated[term]
+            validated_pop(term, None)
 
-        return len(terms_to_remove)
+        return len(terms)
 
     def remove_low_confidence_terms(self, min_occurrences: int = 2) -> int:
         """
@@ -543,20 +676,13 @@ class Glossary:
             >>> removed_count = glossary.remove_low_confidence_terms(min_occurrences=2)
             >>> print(f"{removed_count} termes à faible confiance supprimés")
         """
-        terms_to_remove = []
-
-        for source_term, translations in self._glossary.items():
-            total_occurrences = sum(translations.values())
-            if total_occurrences < min_occurrences:
-                terms_to_remove.append(source_term)
-
-        for term in terms_to_remove:
-            del self._glossary[term]
-            # Supprimer aussi des validations si présent
-            if term in self._validated:
-                del self._validated[term]
+        terms_to_remove = [
+            term
+            for term, translations in self._glossary.items()
+            if translations.occurrences < min_occurrences
+        ]
 
-        return len(terms_to_remove)
+        return self._remove_terms(terms_to_remove)
 
     def clean_all(
         self, min_occurrences: int = 2, verbose: bool = True
@@ -564,10 +690,13 @@ class Glossary:
         """
         Nettoie le glossaire en appliquant tous les filtres.
 
-        Applique dans l'ordre :
+        Applique en une seule passe sur le glossaire :
         1. Suppression des stopwords grammaticaux
         2. Suppression des termes à faible confiance
 
+        Un terme déjà classé stopword n'est pas compté en faible confiance,
+        comme si les deux nettoyages étaient appliqués successivement.
+
         Args:
             min_occurrences: Seuil minimum pour remove_low_confidence_terms (défaut: 2)
             verbose: Affiche les statistiques de nettoyage (défaut: True)
@@ -579,35 +708,38 @@ class Glossary:
             >>> stats = glossary.clean_all()
             >>> # {'stopwords': 123, 'low_confidence': 45, 'total': 168}
         """
+        from .glossary_filters import should_exclude_from_glossary
         from .logger import get_logger
 
         logger = get_logger(__name__)
 
         if verbose:
-            stats_before = self.get_statistics()
             logger.info("🧹 Nettoyage du glossaire...")
-            logger.info(f"  Avant : {stats_before['total_terms']} termes")
+            logger.info(f"  Avant : {self.get_term_count()} termes")
 
-        # Étape 1 : Stopwords
-        stopwords_removed = self.clean_stopwords()
-        if verbose:
-            logger.info(f"  Stopwords supprimés : {stopwords_removed}")
+        stopwords: list[str] = []
+        low_confidence: list[str] = []
 
-        # Étape 2 : Faible confiance
-        low_conf_removed = self.remove_low_confidence_terms(min_occurrences)
-        if verbose:
-            logger.info(f"  Faible confiance supprimés : {low_conf_removed}")
+        for source_term, translations in self._glossary.items():
+            if should_exclude_from_glossary(source_term):
+                stopwords.append(source_term)
+            elif translations.occurrences < min_occurrences:
+                low_confidence.append(source_term)
+
+        stopwords_removed = self._remove_terms(stopwords)
+        low_conf_removed = self._remove_terms(low_confidence)
+        total_removed = stopwords_removed + low_conf_removed
 
         if verbose:
-            stats_after = self.get_statistics()
-            total_removed = stopwords_removed + low_conf_removed
-            logger.info(f"  Après : {stats_after['total_terms']} termes")
+            logger.info(f"  Stopwords supprimés : {stopwords_removed}")
+            logger.info(f"  Faible confiance supprimés : {low_conf_removed}")
+            logger.info(f"  Après : {self.get_term_count()} termes")
             logger.info(f"✅ Total supprimé : {total_removed} termes")
 
         return {
             "stopwords": stopwords_removed,
             "low_confidence": low_conf_removed,
-            "total": stopwords_removed + low_conf_removed,
+            "total": total_removed,
         }
 
     # =========================================================================
@@ -663,6 +795,8 @@ class Glossary:
             self._glossary.clear()
             self._validated.clear()
 
+        self._invalidate_conflicts()
+
     def __repr__(self) -> str:
         """Représentation pour le debug."""
         stats = self.get_statistics()
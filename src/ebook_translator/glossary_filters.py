@@ -7,9 +7,13 @@ Ce module fournit des listes de mots à exclure du glossaire terminologique :
 - Helpers pour détection d'erreurs d'extraction
 """
 
+import re
+from functools import lru_cache
+
 # Mots grammaticaux à TOUJOURS exclure du glossaire
 # Ces mots sont contextuels et varient selon la phrase
-GRAMMATICAL_STOPWORDS = {
+# frozenset construit une seule fois à l'import (lookup O(1), immuable)
+GRAMMATICAL_STOPWORDS: frozenset[str] = frozenset({
     # Articles
     "a",
     "an",
@@ -220,7 +224,15 @@ GRAMMATICAL_STOPWORDS = {
     "huh",
     "hey",
     "wow",
-}
+})
+
+# Longueur du plus long stopword : tout mot plus long est rejeté d'emblée,
+# sans allouer sa version minuscule (str.lower() n'en réduit jamais la longueur)
+_MAX_STOPWORD_LENGTH = max(map(len, GRAMMATICAL_STOPWORDS))
+
+# Caractère répété n'importe où dans le mot (sensible à la casse)
+# Équivalent de any(word.count(c) >= 2 for c in set(word)), évalué en C
+_REPEATED_CHAR_RE = re.compile(r"(.).*\1", re.DOTALL)
 
 # Patterns de mots à exclure
 # Utilisés pour filtrage additionnel
@@ -247,9 +259,10 @@ def is_grammatical_stopword(word: str) -> bool:
         >>> is_grammatical_stopword("Matrix")
         False
     """
-    return word.lower() in GRAMMATICAL_STOPWORDS
+    return len(word) <= _MAX_STOPWORD_LENGTH and word.lower() in GRAMMATICAL_STOPWORDS
 
 
+@lru_cache(maxsize=8192)
 def should_exclude_from_glossary(word: str) -> bool:
     """
     Détermine si un mot doit être exclu du glossaire.
@@ -259,6 +272,9 @@ def should_exclude_from_glossary(word: str) -> bool:
     - Mots très courts (<= 2 chars) sauf noms propres
     - Mots correspondant aux patterns d'exclusion
 
+    Le résultat est mémoïsé (lru_cache) : learn() rencontre sans cesse
+    les mêmes tokens au fil d'un livre.
+
     Args:
         word: Mot à vérifier
 
@@ -275,19 +291,18 @@ def should_exclude_from_glossary(word: str) -> bool:
         >>> should_exclude_from_glossary("Dr")
         False  # Nom propre court accepté
     """
-    # Stopwords grammaticaux
-    if is_grammatical_stopword(word):
+    length = len(word)
+
+    # Stopwords grammaticaux (lookup inline, une seule mise en minuscule)
+    if length <= _MAX_STOPWORD_LENGTH and word.lower() in GRAMMATICAL_STOPWORDS:
         return True
 
     # Mots très courts (1 lettre) toujours exclus
-    if len(word) == 1:
+    if length == 1:
         return True
 
     # Mots de 2 lettres exclus SAUF si commencent par majuscule (ex: "Dr")
-    if len(word) == 2 and word[0].islower():
-        return True
-
-    return False
+    return length == 2 and word[0].islower()
 
 
 def is_likely_extraction_error(
@@ -314,19 +329,20 @@ def is_likely_extraction_error(
         >>> is_likely_extraction_error("Matrix", "Matrice")
         False  # Traduction légitime
     """
-    # Cas 1 : Source grammatical + Traduction commence par majuscule
-    if is_grammatical_stopword(source_term) and translated_term[0].isupper():
-        return True
-
-    # Cas 2 : Différence de longueur excessive (ratio > 5)
-    if len(source_term) > 0 and len(translated_term) > 0:
-        ratio = max(len(source_term), len(translated_term)) / min(
-            len(source_term), len(translated_term)
-        )
-        if ratio > 5:
+    source_length = len(source_term)
+    translated_length = len(translated_term)
+
+    # Cas 1 : Différence de longueur excessive (ratio > 5)
+    # Testé en premier : simple arithmétique, sans str.lower() ni lookup
+    if source_length and translated_length:
+        if (
+            translated_length > 5 * source_length
+            or source_length > 5 * translated_length
+        ):
             return True  # Ex: "of" (2) → "Association" (11)
 
-    return False
+    # Cas 2 : Source grammatical + Traduction commence par majuscule
+    return translated_term[:1].isupper() and is_grammatical_stopword(source_term)
 
 
 def categorize_conflict(source_term: str, translations: list[str]) -> str:
@@ -354,18 +370,23 @@ def categorize_conflict(source_term: str, translations: list[str]) -> str:
         >>> categorize_conflict("Association", ["Association", "Guilde"])
         "proper_noun"
     """
+    # Les listes ne sont pas hashables : le cache est indexé sur un tuple
+    return _categorize_conflict_cached(source_term, tuple(translations))
+
+
+@lru_cache(maxsize=4096)
+def _categorize_conflict_cached(source_term: str, translations: tuple[str, ...]) -> str:
+    """Implémentation mémoïsée de categorize_conflict()."""
     # Catégorie 1 : Grammatical
     if is_grammatical_stopword(source_term):
         return "grammatical"
 
-    # Catégorie 2 : Onomatopée (3 lettres ou moins, répétition de lettres)
-    if len(source_term) <= 4 and any(
-        source_term.count(c) >= 2 for c in set(source_term)
-    ):
+    # Catégorie 2 : Onomatopée (4 lettres ou moins, répétition de lettres)
+    if len(source_term) <= 4 and _REPEATED_CHAR_RE.search(source_term):
         return "onomatopoeia"
 
     # Catégorie 3 : Nom propre (commence par majuscule)
-    if source_term[0].isupper():
+    if source_term[:1].isupper():
         # Si toutes traductions commencent par majuscule → nom propre
         if all(t[0].isupper() for t in translations):
             return "proper_noun"
@@ -374,6 +395,46 @@ def categorize_conflict(source_term: str, translations: list[str]) -> str:
     return "contextual"
 
 
+def partition_conflicts(
+    conflicts: dict[str, list[str]],
+) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
+    """
+    Sépare les conflits en haute et basse priorité en une seule passe.
+
+    Chaque conflit n'est catégorisé qu'une fois. Un conflit contextuel dont
+    toutes les traductions sont grammaticales n'apparaît dans aucun des deux.
+
+    Args:
+        conflicts: Dictionnaire {terme: [traductions]}
+
+    Returns:
+        Tuple (haute_priorité, basse_priorité)
+
+    Example:
+        >>> high, low = partition_conflicts({
+        ...     "after": ["Après", "Au"],
+        ...     "Association": ["Association", "Guilde"]
+        ... })
+        >>> list(high), list(low)
+        (['Association'], ['after'])
+    """
+    high_priority: dict[str, list[str]] = {}
+    low_priority: dict[str, list[str]] = {}
+
+    for source, translations in conflicts.items():
+        category = categorize_conflict(source, translations)
+
+        # Basse priorité : grammaticaux et onomatopées
+        if category in ("grammatical", "onomatopoeia"):
+            low_priority[source] = translations
+        # Haute priorité : noms propres et contextuels,
+        # sauf si toutes les traductions sont grammaticales
+        elif not all(is_grammatical_stopword(t) for t in translations):
+            high_priority[source] = translations
+
+    return high_priority, low_priority
+
+
 def get_high_priority_conflicts(conflicts: dict[str, list[str]]) -> dict[str, list[str]]:
     """
     Filtre les conflits haute priorité (noms propres/termes techniques).
@@ -395,18 +456,7 @@ def get_high_priority_conflicts(conflicts: dict[str, list[str]]) -> dict[str, li
         >>> "after" in high_priority
         False
     """
-    high_priority = {}
-
-    for source, translations in conflicts.items():
-        category = categorize_conflict(source, translations)
-
-        # Haute priorité : noms propres et contextuels
-        if category in ["proper_noun", "contextual"]:
-            # Exclure si toutes traductions sont grammaticales
-            if not all(is_grammatical_stopword(t) for t in translations):
-                high_priority[source] = translations
-
-    return high_priority
+    return partition_conflicts(conflicts)[0]
 
 
 def get_low_priority_conflicts(conflicts: dict[str, list[str]]) -> dict[str, list[str]]:
@@ -430,13 +480,10 @@ def get_low_priority_conflicts(conflicts: dict[str, list[str]]) -> dict[str, lis
         >>> "Ahh" in low_priority
         True
     """
-    low_priority = {}
+    return partition_conflicts(conflicts)[1]
 
-    for source, translations in conflicts.items():
-        category = categorize_conflict(source, translations)
-
-        # Basse priorité : grammaticaux et onomatopées
-        if category in ["grammatical", "onomatopoeia"]:
-            low_priority[source] = translations
 
-    return low_priority
+def _reset_caches() -> None:
+    """Vide les caches des prédicats mémoïsés (utile pour les tests)."""
+    should_exclude_from_glossary.cache_clear()
+    _categorize_conflict_cached.cache_clear()
@@ -6,9 +6,10 @@ en encapsulant toute la logique métier nécessaire (extraction texte,
 export glossaire, calculs, etc.).
 """
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Literal
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 
 from ..config import TemplateNames
 
@@ -28,6 +29,20 @@ if TYPE_CHECKING:
     from ..stores.multi_store import MultiStore
 
 
+@lru_cache(maxsize=None)
+def _get_environment(prompt_dir: str) -> Environment:
+    """
+    Retourne l'environnement Jinja2 partagé pour un répertoire de templates.
+
+    Tous les renderers (donc toutes les instances LLM) pointant vers le même
+    répertoire partagent ainsi le cache de templates compilés de Jinja2.
+    """
+    return Environment(
+        loader=FileSystemLoader(prompt_dir),
+        autoescape=select_autoescape(["html", "xml"]),
+    )
+
+
 class TemplateRenderer:
     """
     Encapsule le rendu des templates avec typage fort et logique métier centralisée.
@@ -55,10 +70,10 @@ class TemplateRenderer:
         Args:
             llm: Instance LLM pour accéder à render_prompt()
         """
-        self.env = Environment(
-            loader=FileSystemLoader(prompt_dir),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
+        self.env = _get_environment(prompt_dir)
+
+        # Templates compilés déjà résolus (évite le lookup + stat de get_template)
+        self._templates: dict[str, Template] = {}
 
     # -----------------------------------
     # 🔹 Rendu du template
@@ -85,7 +100,11 @@ class TemplateRenderer:
         Returns:
             Prompt rendu
         """
-        template = self.env.get_template(template_name)
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self._templates[template_name] = self.env.get_template(
+                template_name
+            )
         return template.render(**kwargs)
 
     def render_translate(self, target_language: str) -> str:
@@ -17,6 +17,10 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Réponses acceptées pour la confirmation finale (entrée normalisée en minuscules)
+_YES_ANSWERS = frozenset({"", "o", "oui", "y", "yes"})
+_NO_ANSWERS = frozenset({"n", "non", "no"})
+
 
 class GlossaryValidator:
     """
@@ -151,14 +155,9 @@ class GlossaryValidator:
         Args:
             conflicts: Dictionnaire {terme_source: [traductions_conflictuelles]}
         """
-        from ..glossary_filters import (
-            get_high_priority_conflicts,
-            get_low_priority_conflicts,
-            categorize_conflict,
-        )
+        from ..glossary_filters import partition_conflicts, categorize_conflict
 
-        high_priority = get_high_priority_conflicts(conflicts)
-        low_priority = get_low_priority_conflicts(conflicts)
+        high_priority, low_priority = partition_conflicts(conflicts)
 
         logger.info("\n⚠️  CONFLITS TERMINOLOGIQUES:")
         logger.info(f"  • Total: {len(conflicts)} conflit(s)")
@@ -171,7 +170,7 @@ class GlossaryValidator:
             for source_term, translations in sorted(high_priority.items()):
                 category = categorize_conflict(source_term, translations)
                 term_data = self.glossary._glossary[source_term]
-                total = sum(term_data.values())
+                total = term_data.occurrences
 
                 logger.info(f"\n  • {source_term} [{category}]:")
                 for trans in translations:
@@ -191,7 +190,7 @@ class GlossaryValidator:
 
                 category = categorize_conflict(source_term, translations)
                 term_data = self.glossary._glossary[source_term]
-                total = sum(term_data.values())
+                total = term_data.occurrences
 
                 logger.info(f"\n  • {source_term} [{category}]:")
                 for trans in translations:
@@ -205,15 +204,16 @@ class GlossaryValidator:
         """
         Résout automatiquement les conflits en choisissant la traduction la plus fréquente.
 
+        Les listes de get_conflicts() sont déjà triées par fréquence décroissante
+        (tri stable : à égalité, la première traduction apprise l'emporte), donc
+        la plus fréquente est simplement le premier élément.
+
         Args:
             conflicts: Dictionnaire {terme_source: [traductions_conflictuelles]}
         """
-        for source_term in conflicts:
-            # Récupérer la traduction la plus fréquente
-            most_frequent = self.glossary.get_translation(
-                source_term, min_confidence=0.0
-            )
-            if most_frequent:
+        for source_term, translations in conflicts.items():
+            if translations:
+                most_frequent = translations[0]
                 self.glossary.validate_translation(source_term, most_frequent)
                 logger.debug(
                     f"  • {source_term} → {most_frequent} (automatique)"
@@ -244,7 +244,7 @@ class GlossaryValidator:
 
         for i, (source_term, translations) in enumerate(sorted(conflicts.items()), 1):
             term_data = self.glossary._glossary[source_term]
-            total = sum(term_data.values())
+            total = term_data.occurrences
 
             logger.info(f"\n[{i}/{len(conflicts)}] Terme: '{source_term}'")
             for j, trans in enumerate(translations, 1):
@@ -267,12 +267,9 @@ class GlossaryValidator:
                         break
 
                     if choice == 'a':
-                        most_frequent = self.glossary.get_translation(
-                            source_term, min_confidence=0.0
-                        )
-                        if most_frequent:
-                            self.glossary.validate_translation(source_term, most_frequent)
-                            logger.info(f"✅ Résolu automatiquement: {source_term} → {most_frequent}")
+                        most_frequent = translations[0]
+                        self.glossary.validate_translation(source_term, most_frequent)
+                        logger.info(f"✅ Résolu automatiquement: {source_term} → {most_frequent}")
                         break
 
                     # Choix numérique
@@ -295,12 +292,9 @@ class GlossaryValidator:
         if skipped_terms:
             logger.info(f"\n🤖 Résolution automatique de {len(skipped_terms)} terme(s) passé(s)...")
             for source_term in skipped_terms:
-                most_frequent = self.glossary.get_translation(
-                    source_term, min_confidence=0.0
-                )
-                if most_frequent:
-                    self.glossary.validate_translation(source_term, most_frequent)
-                    logger.debug(f"  • {source_term} → {most_frequent}")
+                most_frequent = conflicts[source_term][0]
+                self.glossary.validate_translation(source_term, most_frequent)
+                logger.debug(f"  • {source_term} → {most_frequent}")
 
         logger.info("\n✅ Tous les conflits ont été résolus")
         return True
@@ -324,10 +318,10 @@ class GlossaryValidator:
                     "Valider ce glossaire pour la Phase 2 ? [O/n]: "
                 ).strip().lower()
 
-                if choice in ['', 'o', 'oui', 'y', 'yes']:
+                if choice in _YES_ANSWERS:
                     logger.info("✅ Glossaire validé")
                     return True
-                elif choice in ['n', 'non', 'no']:
+                elif choice in _NO_ANSWERS:
                     logger.warning("❌ Validation annulée par l'utilisateur")
                     return False
                 else:
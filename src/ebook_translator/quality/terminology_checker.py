@@ -11,7 +11,7 @@ Exemples :
 
 import re
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterable, Optional
 from collections import defaultdict
 
 
@@ -113,6 +113,22 @@ class TerminologyChecker:
         )
         self._translations[source_normalized][trans_normalized].append(pos)
 
+    def add_pairs(
+        self,
+        pairs: Iterable[tuple[str, str, Optional[int]]],
+    ) -> None:
+        """
+        Enregistre plusieurs paires source → traduction en une fois.
+
+        Équivalent à appeler add_pair() pour chaque paire, dans l'ordre.
+
+        Args:
+            pairs: Triplets (terme_source, traduction, position)
+        """
+        add_pair = self.add_pair
+        for source_term, translated_term, position in pairs:
+            add_pair(source_term, translated_term, position)
+
     def get_issues(self, min_confidence: float = 0.7) -> list[TerminologyIssue]:
         """
         Récupère toutes les incohérences détectées.
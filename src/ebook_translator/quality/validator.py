@@ -7,7 +7,7 @@ détection de segments non traduits, cohérence terminologique, etc.
 Usage optionnel, indépendant du pipeline principal de validation.
 """
 
-from typing import Optional
+from typing import Iterable, Optional
 from pathlib import Path
 
 from ..logger import get_logger
@@ -137,6 +137,27 @@ class QualityValidator:
 
         return not has_issues
 
+    def validate_batch(
+        self,
+        pairs: Iterable[tuple[str, str, Optional[int]]],
+    ) -> list[bool]:
+        """
+        Valide plusieurs paires original → traduit, dans l'ordre.
+
+        Équivalent à appeler validate_translation() pour chaque paire.
+
+        Args:
+            pairs: Triplets (original, traduit, position)
+
+        Returns:
+            Résultat de validate_translation() pour chaque paire
+        """
+        validate = self.validate_translation
+        return [
+            validate(original, translated, position)
+            for original, translated, position in pairs
+        ]
+
     def get_all_issues(self) -> dict[str, list]:
         """
         Récupère tous les problèmes détectés.
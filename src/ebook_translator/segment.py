@@ -7,6 +7,7 @@ contexte entre les chunks via un système de chevauchement (overlap).
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Iterator, TYPE_CHECKING
 
 import tiktoken
@@ -28,7 +29,18 @@ DEFAULT_OVERLAP_RATIO = 0.15
 DEFAULT_ENCODING = "o200k_base"
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _count_tokens(encoding: tiktoken.Encoding, text: str) -> int:
+    """
+    Compte les tokens de `text` (mémoïsé).
+
+    Les mêmes textes sont recomptés lors du remplissage du head (overlap) ;
+    l'encodeur, singleton par nom chez tiktoken, fait partie de la clé.
+    """
+    return len(encoding.encode(text))
+
+
+@dataclass(slots=True)
 class Chunk:
     """
     Représente un morceau de contenu EPUB à traduire.
@@ -310,7 +322,7 @@ class Segmentator:
         Returns:
             Nombre de tokens selon l'encodage configuré
         """
-        return len(self._encoding.encode(text))
+        return _count_tokens(self._encoding, text)
 
     def get_all_segments(self) -> Iterator[Chunk]:
         """
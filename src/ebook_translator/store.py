@@ -27,6 +27,13 @@ from typing import TYPE_CHECKING, Optional
 
 from .logger import get_logger
 
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 if TYPE_CHECKING:
     from .segment import Chunk
@@ -35,6 +42,30 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def _dumps(data: dict[str, str]) -> bytes:
+    """
+    Sérialise un cache en JSON UTF-8 indenté (2 espaces, sans échappement ASCII).
+
+    Utilise orjson si disponible ; le fichier produit est identique à celui
+    de json.dumps(..., ensure_ascii=False, indent=2).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads(content: bytes) -> dict[str, str]:
+    """
+    Désérialise un cache JSON (orjson si disponible).
+
+    orjson.JSONDecodeError hérite de json.JSONDecodeError : la gestion des
+    caches corrompus reste la même.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 class Store:
     """
     Gestionnaire de persistance pour les traductions d'ebooks.
@@ -138,11 +169,11 @@ class Store:
             try:
                 # Lire le contenu, puis fermer explicitement avant de parser
                 # Cela garantit que le fichier est fermé au niveau OS avant de retourner
-                with open(cache_file, "r", encoding="utf-8") as f:
+                with open(cache_file, "rb") as f:
                     content = f.read()
 
                 # Parser après fermeture du fichier
-                data: dict[str, str] = json.loads(content)
+                data: dict[str, str] = _loads(content)
                 return data
 
             except (IOError, OSError) as e:
@@ -194,8 +225,8 @@ class Store:
             temp_file = cache_file.with_suffix(f".json.tmp.{uuid.uuid4().hex[:8]}")
             try:
                 # Écrire dans un fichier temporaire
-                with open(temp_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                with open(temp_file, "wb") as f:
+                    f.write(_dumps(data))
                     # Forcer flush avant fermeture (important sur Windows)
                     f.flush()
                     os.fsync(f.fileno())
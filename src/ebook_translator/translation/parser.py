@@ -3,7 +3,7 @@ Parsing des sorties de traduction des LLM.
 """
 
 import re
-from typing import Optional
+from typing import Iterable, Optional
 
 
 def parse_llm_translation_output(output: str) -> dict[int, str]:
@@ -105,7 +105,7 @@ def parse_llm_translation_output(output: str) -> dict[int, str]:
 
 def validate_retry_indices(
     retry_translations: dict[int, str],
-    expected_indices: list[int],
+    expected_indices: Iterable[int],
 ) -> tuple[bool, Optional[str]]:
     """
     Valide que le retry a fourni exactement les indices demandés.
@@ -116,7 +116,7 @@ def validate_retry_indices(
 
     Args:
         retry_translations: Dictionnaire {index: texte_traduit} retourné par le retry
-        expected_indices: Liste des indices qui devaient être traduits
+        expected_indices: Indices qui devaient être traduits (liste, range, set...)
 
     Returns:
         Tuple (is_valid, error_message)
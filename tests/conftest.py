@@ -22,3 +22,39 @@ def tmp_cache_dir(tmp_path):
     cache_dir = tmp_path / "cache"
     cache_dir.mkdir(exist_ok=True)
     return cache_dir
+
+
+@pytest.fixture(scope="session")
+def default_llm():
+    """
+    Fixture fournissant une instance LLM construite avec les paramètres par défaut.
+
+    Partagée par toute la session : les tests ne doivent pas la modifier.
+    Aucun appel réseau n'est fait à la construction.
+
+    Returns:
+        Instance LLM (modèle, URL et clé factices)
+    """
+    from ebook_translator.llm import LLM
+
+    return LLM(
+        model_name="test-model",
+        url="https://api.example.com",
+        api_key="test-key",
+    )
+
+
+@pytest.fixture
+def glossary(tmp_path):
+    """
+    Fixture fournissant un glossaire vide, propre à chaque test.
+
+    Args:
+        tmp_path: Fixture pytest fournissant un répertoire temporaire
+
+    Returns:
+        Glossary dont le cache_path pointe dans le répertoire du test
+    """
+    from ebook_translator.glossary import Glossary
+
+    return Glossary(cache_path=tmp_path / "glossary.json")
@@ -0,0 +1,16 @@
+"""
+Utilitaires partagés par les tests ebook-translator.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, eq=False)
+class FakeTagKey:
+    """
+    Substitut léger de TagKey : seuls `.index` et `.page` sont lus.
+
+    eq=False conserve le hash par identité, comme un vrai TagKey.
+    """
+    index: str = ""
+    page: object = None
@@ -8,6 +8,9 @@ Ce module teste les fonctionnalités de nettoyage du glossaire :
 - Méthodes de nettoyage (clean_stopwords, remove_low_confidence_terms, clean_all)
 """
 
+import copy
+import pickle
+
 import pytest
 from pathlib import Path
 
@@ -19,40 +22,48 @@ from ebook_translator.glossary_filters import (
     categorize_conflict,
     get_high_priority_conflicts,
     get_low_priority_conflicts,
+    partition_conflicts,
+    _reset_caches,
 )
 
 
 class TestStopwordDetection:
     """Tests pour détection de stopwords."""
 
-    def test_is_grammatical_stopword_articles(self):
-        """Test : Détection d'articles."""
-        assert is_grammatical_stopword("the")
-        assert is_grammatical_stopword("a")
-        assert is_grammatical_stopword("an")
-        assert not is_grammatical_stopword("Matrix")
-
-    def test_is_grammatical_stopword_pronouns(self):
-        """Test : Détection de pronoms."""
-        assert is_grammatical_stopword("he")
-        assert is_grammatical_stopword("she")
-        assert is_grammatical_stopword("they")
-        assert is_grammatical_stopword("it")
-        assert not is_grammatical_stopword("Sakamoto")
-
-    def test_is_grammatical_stopword_prepositions(self):
-        """Test : Détection de prépositions."""
-        assert is_grammatical_stopword("in")
-        assert is_grammatical_stopword("on")
-        assert is_grammatical_stopword("after")
-        assert is_grammatical_stopword("before")
-        assert not is_grammatical_stopword("Association")
-
-    def test_is_grammatical_stopword_case_insensitive(self):
-        """Test : Détection insensible à la casse."""
-        assert is_grammatical_stopword("The")
-        assert is_grammatical_stopword("THE")
-        assert is_grammatical_stopword("In")
+    @pytest.mark.parametrize(
+        "word, expected",
+        [
+            # Articles
+            ("the", True),
+            ("a", True),
+            ("an", True),
+            # Pronoms
+            ("he", True),
+            ("she", True),
+            ("they", True),
+            ("it", True),
+            # Prépositions
+            ("in", True),
+            ("on", True),
+            ("after", True),
+            ("before", True),
+            # Insensible à la casse
+            ("The", True),
+            ("THE", True),
+            ("In", True),
+            # Borne de longueur (plus long stopword)
+            ("furthermore", True),
+            ("FURTHERMORE", True),
+            # Noms propres / termes
+            ("Matrix", False),
+            ("Sakamoto", False),
+            ("Association", False),
+            ("Administration", False),
+        ],
+    )
+    def test_is_grammatical_stopword(self, word: str, expected: bool):
+        """Test : Détection de stopwords (articles, pronoms, prépositions, casse)."""
+        assert is_grammatical_stopword(word) is expected
 
 
 class TestExclusionLogic:
@@ -85,6 +96,19 @@ class TestExclusionLogic:
         assert not should_exclude_from_glossary("Sakamoto")
         assert not should_exclude_from_glossary("Association")
 
+    def test_should_exclude_is_memoized(self):
+        """Test : Résultats mis en cache, vidables via _reset_caches()."""
+        _reset_caches()
+        should_exclude_from_glossary("the")
+        should_exclude_from_glossary("the")
+
+        info = should_exclude_from_glossary.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+        _reset_caches()
+        assert should_exclude_from_glossary.cache_info().currsize == 0
+
 
 class TestExtractionErrors:
     """Tests pour détection d'erreurs d'extraction."""
@@ -176,14 +200,28 @@ class TestPriorityFiltering:
         assert "Ahh" in low_priority
         assert "Association" not in low_priority
 
+    def test_partition_conflicts_matches_getters(self):
+        """Test : partition_conflicts() équivaut aux deux filtres séparés."""
+        conflicts = {
+            "after": ["Après", "Au"],
+            "Association": ["Association", "Guilde"],
+            "Ahh": ["Ahh", "Aah"],
+            "guild": ["guilde", "corporation"],
+        }
+
+        high_priority, low_priority = partition_conflicts(conflicts)
+
+        assert high_priority == get_high_priority_conflicts(conflicts)
+        assert low_priority == get_low_priority_conflicts(conflicts)
+        assert set(high_priority) == {"Association", "guild"}
+        assert set(low_priority) == {"after", "Ahh"}
+
 
 class TestGlossaryLearnFiltering:
     """Tests pour filtrage automatique dans learn()."""
 
-    def test_learn_filters_stopwords_automatically(self, tmp_path):
+    def test_learn_filters_stopwords_automatically(self, glossary: Glossary):
         """Test : learn() filtre automatiquement les stopwords."""
-        glossary = Glossary(cache_path=tmp_path / "glossary.json")
-
         # Apprendre des stopwords (doivent être ignorés)
         glossary.learn("the", "le")
         glossary.learn("after", "Après")
@@ -192,10 +230,8 @@ class TestGlossaryLearnFiltering:
         # Vérifier qu'ils n'ont pas été ajoutés
         assert glossary.get_term_count() == 0
 
-    def test_learn_accepts_proper_nouns(self, tmp_path):
+    def test_learn_accepts_proper_nouns(self, glossary: Glossary):
         """Test : learn() accepte les noms propres."""
-        glossary = Glossary(cache_path=tmp_path / "glossary.json")
-
         glossary.learn("Matrix", "Matrice")
         glossary.learn("Sakamoto", "Sakamoto")
         glossary.learn("Association", "Guilde")
@@ -203,10 +239,8 @@ class TestGlossaryLearnFiltering:
         assert glossary.get_term_count() == 3
         assert glossary.get_translation("Matrix") == "Matrice"
 
-    def test_learn_filters_short_words(self, tmp_path):
+    def test_learn_filters_short_words(self, glossary: Glossary):
         """Test : learn() filtre mots très courts."""
-        glossary = Glossary(cache_path=tmp_path / "glossary.json")
-
         # Mots courts (1-2 lettres en minuscule)
         glossary.learn("a", "un")
         glossary.learn("I", "je")
@@ -216,24 +250,36 @@ class TestGlossaryLearnFiltering:
         # Tous doivent être filtrés
         assert glossary.get_term_count() == 0
 
-    def test_learn_accepts_short_proper_nouns(self, tmp_path):
+    def test_learn_accepts_short_proper_nouns(self, glossary: Glossary):
         """Test : learn() accepte noms propres courts (majuscule)."""
-        glossary = Glossary(cache_path=tmp_path / "glossary.json")
-
         glossary.learn("Dr", "Dr")
         glossary.learn("Mr", "M")
 
         # Doivent être acceptés (commencent par majuscule)
         assert glossary.get_term_count() == 2
 
+    def test_learn_many_matches_learn(self, glossary: Glossary):
+        """Test : learn_many() filtre et compte comme learn()."""
+        learned = glossary.learn_many(
+            [
+                ("the", "le"),  # Stopword → ignoré
+                ("a", "un"),  # Lettre isolée → ignorée
+                ("Matrix", "Matrice"),
+                ("Matrix", "Matrice"),
+                ("Dr", "Dr"),
+            ]
+        )
+
+        assert learned == 3
+        assert glossary.get_term_count() == 2
+        assert glossary._glossary["Matrix"]["Matrice"] == 2
+
 
 class TestGlossaryCleanStopwords:
     """Tests pour clean_stopwords()."""
 
-    def test_clean_stopwords_removes_grammatical_words(self, tmp_path):
+    def test_clean_stopwords_removes_grammatical_words(self, glossary: Glossary):
         """Test : clean_stopwords() supprime mots grammaticaux."""
-        glossary = Glossary(cache_path=tmp_path / "glossary.json")
-
         # Ajouter directement (bypass learn() filtering)
         glossary._glossary["the"]["le"] = 5
         glossary._glossary["after"]["Après"] = 3
@@ -249,10 +295,8 @@ class TestGlossaryCleanStopwords:
         assert "the" not in glossary._glossary
         assert "after" not in glossary._glossary
 
-    def test_clean_stopwords_removes_from_validated(self, tmp_path):
+    def test_clean_stopwords_removes_from_validated(self, glossary: Glossary):
         """Test : clean_stopwords() supprime aussi des validations."""
-        glossary = Glossary(cache_path=tmp_path / "glossary.json")
-
         glossary._glossary["the"]["le"] = 5
         glossary._validated["the"] = "le"  # Validé manuellement
 
@@ -265,10 +309,8 @@ class TestGlossaryCleanStopwords:
 class TestGlossaryRemoveLowConfidence:
     """Tests pour remove_low_confidence_terms()."""
 
-    def test_remove_low_confidence_removes_single_occurrence(self, tmp_path):
+    def test_remove_low_confidence_removes_single_occurrence(self, glossary: Glossary):
         """Test : Suppression termes avec 1 seule occurrence."""
-        glossary = Glossary(cache_path=tmp_path / "glossary.json")
-
         glossary._glossary["Matrix"]["Matrice"] = 10
         glossary._glossary["Rare"]["Rarissime"] = 1  # 1 occurrence → supprimé
         glossary._glossary["Another"]["Autre"] = 1  # 1 occurrence → supprimé
@@ -281,10 +323,8 @@ class TestGlossaryRemoveLowConfidence:
         assert glossary.get_term_count() == 1
         assert "Matrix" in glossary._glossary
 
-    def test_remove_low_confidence_keeps_high_frequency(self, tmp_path):
+    def test_remove_low_confidence_keeps_high_frequency(self, glossary: Glossary):
         """Test : Préservation termes fréquents."""
-        glossary = Glossary(cache_path=tmp_path / "glossary.json")
-
         glossary._glossary["Matrix"]["Matrice"] = 5
         glossary._glossary["Matrix"]["Système"] = 3  # Total = 8 → conservé
 
@@ -293,14 +333,81 @@ class TestGlossaryRemoveLowConfidence:
         assert removed == 0
         assert "Matrix" in glossary._glossary
 
+    def test_translation_totals_track_mutations(self, glossary: Glossary):
+        """Test : Le total par terme suit learn(), les écritures et suppressions."""
+        glossary.learn("Matrix", "Matrice")
+        glossary.learn("Matrix", "Matrice")
+        glossary._glossary["Matrix"]["Système"] = 3
+        assert glossary._glossary["Matrix"].occurrences == 5
+
+        glossary._glossary["Matrix"]["Système"] = 1  # Réaffectation
+        assert glossary._glossary["Matrix"].occurrences == 3
+
+        del glossary._glossary["Matrix"]["Matrice"]
+        assert glossary._glossary["Matrix"].occurrences == 1
+
+    def test_translation_totals_track_dict_mutators(self, glossary: Glossary):
+        """Test : pop/update/setdefault/popitem/clear et les copies gardent le total exact."""
+        counts = glossary._glossary["Matrix"]
+        counts.update({"Matrice": 4, "Système": 2})
+        assert counts.occurrences == 6
+
+        counts.update({"Matrice": 1})  # Counter : les comptes s'additionnent
+        assert counts.occurrences == 7
+
+        assert counts.pop("Système") == 2
+        assert counts.pop("Absent", None) is None
+        assert counts.occurrences == 5
+
+        counts.setdefault("Réseau", 3)
+        assert counts.occurrences == 8
+
+        for clone in (
+            counts.copy(),
+            copy.deepcopy(counts),
+            pickle.loads(pickle.dumps(counts)),
+        ):
+            assert dict(clone) == dict(counts)
+            assert clone.occurrences == 8
+
+        counts.popitem()
+        assert counts.occurrences == sum(counts.values())
+
+        counts.clear()
+        assert counts.occurrences == 0
+
+
+class TestGlossaryConflictCache:
+    """Tests pour le cache de get_conflicts()."""
+
+    def test_conflicts_cache_invalidated_on_mutation(self, glossary: Glossary):
+        """Test : learn() et validate_translation() invalident le cache."""
+        glossary.learn_many([("Matrix", "Matrice"), ("Matrix", "Système")])
+        assert "Matrix" in glossary.get_conflicts()
+
+        glossary.learn_many([("Guild", "Guilde"), ("Guild", "Ordre")])
+        assert set(glossary.get_conflicts()) == {"Matrix", "Guild"}
+
+        glossary.validate_translation("Matrix", "Matrice")
+        assert set(glossary.get_conflicts()) == {"Guild"}
+
+    def test_conflicts_returns_independent_copy(self, glossary: Glossary):
+        """Test : Modifier le résultat ne corrompt pas le cache."""
+        glossary.learn_many([("Matrix", "Matrice"), ("Matrix", "Système")])
+
+        glossary.get_conflicts().clear()
+        glossary.get_conflicts()["Matrix"].append("Réseau")
+
+        conflicts = glossary.get_conflicts()
+        assert "Matrix" in conflicts
+        assert "Réseau" not in conflicts["Matrix"]
+
 
 class TestGlossaryCleanAll:
     """Tests pour clean_all()."""
 
-    def test_clean_all_applies_both_filters(self, tmp_path):
+    def test_clean_all_applies_both_filters(self, glossary: Glossary):
         """Test : clean_all() applique stopwords + faible confiance."""
-        glossary = Glossary(cache_path=tmp_path / "glossary.json")
-
         # Stopwords
         glossary._glossary["the"]["le"] = 5
         glossary._glossary["after"]["Après"] = 3
@@ -321,10 +428,8 @@ class TestGlossaryCleanAll:
         assert glossary.get_term_count() == 1
         assert "Matrix" in glossary._glossary
 
-    def test_clean_all_returns_stats(self, tmp_path):
+    def test_clean_all_returns_stats(self, glossary: Glossary):
         """Test : clean_all() retourne statistiques."""
-        glossary = Glossary(cache_path=tmp_path / "glossary.json")
-
         glossary._glossary["the"]["le"] = 5
         glossary._glossary["Rare"]["Rarissime"] = 1
 
@@ -11,23 +11,27 @@ from ebook_translator.glossary import Glossary
 from ebook_translator.pipeline.glossary_validator import GlossaryValidator
 
 
+def feed_input(monkeypatch: pytest.MonkeyPatch, *responses: str) -> None:
+    """Remplace input() par un itérateur sur les réponses fournies."""
+    answers = iter(responses)
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+
+
+def raise_on_input(prompt: str = "") -> str:
+    """Simule un Ctrl+C pendant la saisie."""
+    raise KeyboardInterrupt
+
+
 @pytest.fixture
 def glossary_with_conflicts(tmp_path: Path) -> Glossary:
     """Crée un glossaire avec des conflits terminologiques."""
     glossary = Glossary(cache_path=tmp_path / "glossary.json")
 
     # Ajouter des termes sans conflit
-    glossary.learn("Sakamoto", "Sakamoto")
-    glossary.learn("Sakamoto", "Sakamoto")
-    glossary.learn("DNA", "ADN")
-    glossary.learn("DNA", "ADN")
-    glossary.learn("DNA", "ADN")
+    glossary.learn_many([("Sakamoto", "Sakamoto")] * 2 + [("DNA", "ADN")] * 3)
 
     # Ajouter un terme avec conflit (traductions équilibrées)
-    glossary.learn("Matrix", "Matrice")
-    glossary.learn("Matrix", "Matrice")
-    glossary.learn("Matrix", "Système")
-    glossary.learn("Matrix", "Système")
+    glossary.learn_many([("Matrix", "Matrice")] * 2 + [("Matrix", "Système")] * 2)
 
     return glossary
 
@@ -37,13 +41,9 @@ def glossary_no_conflicts(tmp_path: Path) -> Glossary:
     """Crée un glossaire sans conflits."""
     glossary = Glossary(cache_path=tmp_path / "glossary.json")
 
-    glossary.learn("Sakamoto", "Sakamoto")
-    glossary.learn("Sakamoto", "Sakamoto")
-    glossary.learn("DNA", "ADN")
-    glossary.learn("DNA", "ADN")
-    glossary.learn("Matrix", "Matrice")
-    glossary.learn("Matrix", "Matrice")
-    glossary.learn("Matrix", "Matrice")
+    glossary.learn_many(
+        [("Sakamoto", "Sakamoto")] * 2 + [("DNA", "ADN")] * 2 + [("Matrix", "Matrice")] * 3
+    )
 
     return glossary
 
@@ -97,28 +97,30 @@ class TestGlossaryValidator:
         assert glossary_with_conflicts._validated.get("Matrix") is not None
         # Devrait choisir "Matrice" ou "Système" (le plus fréquent, ici égal mais déterministe)
         assert glossary_with_conflicts._validated["Matrix"] in ["Matrice", "Système"]
+        # À égalité, la première traduction apprise l'emporte (comme get_translation)
+        assert glossary_with_conflicts._validated["Matrix"] == conflicts["Matrix"][0]
 
     def test_validate_interactive_no_conflicts_with_confirmation(
-        self, glossary_no_conflicts: Glossary
+        self, glossary_no_conflicts: Glossary, monkeypatch
     ):
         """Test validation interactive sans conflits avec confirmation utilisateur."""
         validator = GlossaryValidator(glossary_no_conflicts)
 
         # Simuler confirmation utilisateur (réponse 'o')
-        with patch("builtins.input", return_value="o"):
-            result = validator.validate_interactive(auto_resolve=False)
+        feed_input(monkeypatch, "o")
+        result = validator.validate_interactive(auto_resolve=False)
 
         assert result is True
 
     def test_validate_interactive_no_conflicts_cancelled(
-        self, glossary_no_conflicts: Glossary
+        self, glossary_no_conflicts: Glossary, monkeypatch
     ):
         """Test validation interactive annulée par l'utilisateur."""
         validator = GlossaryValidator(glossary_no_conflicts)
 
         # Simuler annulation (réponse 'n')
-        with patch("builtins.input", return_value="n"):
-            result = validator.validate_interactive(auto_resolve=False)
+        feed_input(monkeypatch, "n")
+        result = validator.validate_interactive(auto_resolve=False)
 
         assert result is False
 
@@ -136,7 +138,7 @@ class TestGlossaryValidator:
         assert glossary_with_conflicts._validated.get("Matrix") is not None
 
     def test_validate_interactive_with_conflicts_manual_choice(
-        self, glossary_with_conflicts: Glossary
+        self, glossary_with_conflicts: Glossary, monkeypatch
     ):
         """Test validation avec choix manuel de traduction."""
         validator = GlossaryValidator(glossary_with_conflicts)
@@ -146,46 +148,48 @@ class TestGlossaryValidator:
         translations = list(conflicts_before["Matrix"])
 
         # Simuler choix manuel : choisir option 1 (Matrice)
-        with patch("builtins.input", side_effect=["1"]):
-            result = validator.validate_interactive(auto_resolve=False)
+        feed_input(monkeypatch, "1")
+        result = validator.validate_interactive(auto_resolve=False)
 
         assert result is True
         # Matrix devrait être validé avec la première option
         assert glossary_with_conflicts._validated["Matrix"] == translations[0]
 
     def test_validate_interactive_with_conflicts_skip_and_auto(
-        self, glossary_with_conflicts: Glossary
+        self, glossary_with_conflicts: Glossary, monkeypatch
     ):
         """Test validation avec skip (résolution auto à la fin)."""
         validator = GlossaryValidator(glossary_with_conflicts)
 
         # Simuler skip ('s')
-        with patch("builtins.input", return_value="s"):
-            result = validator.validate_interactive(auto_resolve=False)
+        feed_input(monkeypatch, "s")
+        result = validator.validate_interactive(auto_resolve=False)
 
         assert result is True
         # Le conflit devrait être résolu automatiquement
         assert glossary_with_conflicts._validated.get("Matrix") is not None
 
-    def test_validate_interactive_quit(self, glossary_with_conflicts: Glossary):
+    def test_validate_interactive_quit(
+        self, glossary_with_conflicts: Glossary, monkeypatch
+    ):
         """Test validation avec quit utilisateur."""
         validator = GlossaryValidator(glossary_with_conflicts)
 
         # Simuler quit ('q')
-        with patch("builtins.input", return_value="q"):
-            result = validator.validate_interactive(auto_resolve=False)
+        feed_input(monkeypatch, "q")
+        result = validator.validate_interactive(auto_resolve=False)
 
         assert result is False
 
     def test_validate_interactive_invalid_then_valid(
-        self, glossary_with_conflicts: Glossary
+        self, glossary_with_conflicts: Glossary, monkeypatch
     ):
         """Test validation avec entrée invalide puis valide."""
         validator = GlossaryValidator(glossary_with_conflicts)
 
         # Simuler entrée invalide puis valide
-        with patch("builtins.input", side_effect=["invalid", "999", "1"]):
-            result = validator.validate_interactive(auto_resolve=False)
+        feed_input(monkeypatch, "invalid", "999", "1")
+        result = validator.validate_interactive(auto_resolve=False)
 
         assert result is True
 
@@ -243,42 +247,46 @@ class TestGlossaryValidator:
 class TestConfirmValidation:
     """Tests pour la confirmation de validation."""
 
-    def test_confirm_validation_yes_variants(self, glossary_no_conflicts: Glossary):
+    def test_confirm_validation_yes_variants(
+        self, glossary_no_conflicts: Glossary, monkeypatch
+    ):
         """Test confirmation avec différentes variantes de 'oui'."""
         validator = GlossaryValidator(glossary_no_conflicts)
 
         for response in ["", "o", "oui", "y", "yes"]:
-            with patch("builtins.input", return_value=response):
-                result = validator._confirm_validation()
-                assert result is True
+            feed_input(monkeypatch, response)
+            result = validator._confirm_validation()
+            assert result is True
 
-    def test_confirm_validation_no_variants(self, glossary_no_conflicts: Glossary):
+    def test_confirm_validation_no_variants(
+        self, glossary_no_conflicts: Glossary, monkeypatch
+    ):
         """Test confirmation avec différentes variantes de 'non'."""
         validator = GlossaryValidator(glossary_no_conflicts)
 
         for response in ["n", "non", "no"]:
-            with patch("builtins.input", return_value=response):
-                result = validator._confirm_validation()
-                assert result is False
+            feed_input(monkeypatch, response)
+            result = validator._confirm_validation()
+            assert result is False
 
     def test_confirm_validation_invalid_then_valid(
-        self, glossary_no_conflicts: Glossary
+        self, glossary_no_conflicts: Glossary, monkeypatch
     ):
         """Test confirmation avec entrée invalide puis valide."""
         validator = GlossaryValidator(glossary_no_conflicts)
 
-        with patch("builtins.input", side_effect=["invalid", "maybe", "o"]):
-            result = validator._confirm_validation()
+        feed_input(monkeypatch, "invalid", "maybe", "o")
+        result = validator._confirm_validation()
 
         assert result is True
 
     def test_confirm_validation_keyboard_interrupt(
-        self, glossary_no_conflicts: Glossary
+        self, glossary_no_conflicts: Glossary, monkeypatch
     ):
         """Test confirmation avec interruption clavier."""
         validator = GlossaryValidator(glossary_no_conflicts)
 
-        with patch("builtins.input", side_effect=KeyboardInterrupt):
-            result = validator._confirm_validation()
+        monkeypatch.setattr("builtins.input", raise_on_input)
+        result = validator._confirm_validation()
 
         assert result is False
@@ -18,7 +18,8 @@ from src.ebook_translator.checks import (
     FilteredLine,
 )
 from src.ebook_translator.segment import Chunk
-from src.ebook_translator.htmlpage import TagKey
+
+from tests.helpers import FakeTagKey
 
 
 @dataclass
@@ -33,6 +34,17 @@ class MockPage:
     epub_html: MockEpubHtml
 
 
+# Pipelines partagés par tous les tests du module.
+# ValidationPipeline ne conserve que sa liste de checks et les checks sont sans
+# état : tout l'état d'une exécution vit dans le ValidationContext passé à
+# validate_and_correct(). Ils peuvent donc être réutilisés (y compris depuis
+# plusieurs threads) tant que personne ne modifie `checks`.
+PIPE_LC = ValidationPipeline([LineCountCheck()])
+PIPE_FC = ValidationPipeline([FragmentCountCheck()])
+PIPE_LC_FC = ValidationPipeline([LineCountCheck(), FragmentCountCheck()])
+PIPE_ALL = ValidationPipeline([LineCountCheck(), FragmentCountCheck(), PunctuationCheck()])
+
+
 def create_mock_chunk(index: int, num_lines: int) -> Chunk:
     """
     Crée un chunk mock pour les tests.
@@ -50,12 +62,9 @@ def create_mock_chunk(index: int, num_lines: int) -> Chunk:
     mock_page = MockPage(epub_html=MockEpubHtml(file_name="test.xhtml"))
 
     for i in range(num_lines):
-        mock_tag = Mock()
-        tag_key = Mock(spec=TagKey)
-        tag_key.index = str(i * 10)  # Indices simulés : 0, 10, 20, ...
-        tag_key.page = mock_page
-
-        chunk.body[tag_key] = f"Line {i} text"
+        # Indices simulés : 0, 10, 20, ...
+        tag_key = FakeTagKey(index=str(i * 10), page=mock_page)
+        chunk.body[tag_key] = f"Line {i} text"  # type: ignore[index]
 
     return chunk
 
@@ -67,26 +76,33 @@ def create_mock_llm():
     return llm
 
 
-def test_line_count_filtering():
+@pytest.mark.parametrize(
+    ("chunk_index", "num_lines", "missing"),
+    [
+        (0, 10, {3, 7}),
+        (5, 5, {3, 4}),
+        (0, 3, {1, 2}),
+    ],
+    ids=["milieu", "fin", "presque-vide"],
+)
+def test_line_count_filtering(chunk_index, num_lines, missing):
     """
     Test : LineCountCheck filtre les lignes manquantes après échec correction.
 
     Scénario :
-    - 10 lignes dans le chunk body
-    - 8 lignes traduites (2 manquantes : indices 3, 7)
-    - 8 lignes originales (attendues)
+    - num_lines lignes dans le chunk body (toutes attendues)
+    - Les lignes de `missing` ne sont pas traduites
     - Correction échoue
-    - Pipeline filtre les 2 lignes manquantes
-    - Sauvegarde 8 lignes valides
+    - Pipeline filtre les lignes manquantes avec des métadonnées complètes
+    - Sauvegarde les lignes valides restantes
     """
     # Arrange
-    chunk = create_mock_chunk(index=0, num_lines=10)
+    chunk = create_mock_chunk(index=chunk_index, num_lines=num_lines)
 
-    # original_texts correspond aux lignes qu'on ATTEND (translated_texts)
-    # Si translated_texts ne contient pas 3 et 7, c'est que ces lignes sont manquantes
-    # Donc original_texts devrait contenir toutes les 10 lignes attendues
-    original_texts = {i: f"Original {i}" for i in range(10)}
-    translated_texts = {i: f"Traduit {i}" for i in range(10) if i not in {3, 7}}
+    # original_texts = toutes les lignes attendues
+    # translated_texts = seulement celles qui ne sont pas dans `missing`
+    original_texts = {i: f"Original {i}" for i in range(num_lines)}
+    translated_texts = {i: f"Traduit {i}" for i in range(num_lines) if i not in missing}
 
     llm = create_mock_llm()
 
@@ -100,28 +116,31 @@ def test_line_count_filtering():
         max_retries=1,
     )
 
-    pipeline = ValidationPipeline([LineCountCheck()])
+    pipeline = PIPE_LC
 
     # Act
     success, final_translations, results = pipeline.validate_and_correct(context)
 
     # Assert
     assert success, "Pipeline devrait réussir avec filtrage"
-    assert len(final_translations) == 8, "8 lignes valides devraient être conservées"
-    assert 3 not in final_translations, "Ligne 3 devrait être filtrée"
-    assert 7 not in final_translations, "Ligne 7 devrait être filtrée"
-    assert len(context.filtered_lines) == 2, f"2 lignes devraient être filtrées, got {len(context.filtered_lines)}"
+    assert len(final_translations) == num_lines - len(missing)
+    assert missing.isdisjoint(final_translations), "Lignes manquantes devraient être filtrées"
+    assert len(context.filtered_lines) == len(missing), (
+        f"{len(missing)} lignes devraient être filtrées, got {len(context.filtered_lines)}"
+    )
 
     # Vérifier FilteredLine
     filtered_indices = {fl.chunk_line for fl in context.filtered_lines}
-    assert filtered_indices == {3, 7}, "Lignes 3 et 7 devraient être dans filtered_lines"
+    assert filtered_indices == missing
 
     # Vérifier métadonnées
     for filtered in context.filtered_lines:
         assert filtered.file_name == "test.xhtml"
-        assert filtered.chunk_index == 0
+        assert filtered.file_line == str(filtered.chunk_line * 10)
+        assert filtered.chunk_index == chunk_index
         assert filtered.check_name == "line_count"
-        assert "manquante" in filtered.reason.lower()
+        assert filtered.reason == "Ligne manquante après correction"
+        assert "Line" in filtered.original_text  # Texte original présent
 
 
 def test_fragment_count_filtering():
@@ -158,7 +177,7 @@ def test_fragment_count_filtering():
         max_retries=1,
     )
 
-    pipeline = ValidationPipeline([FragmentCountCheck()])
+    pipeline = PIPE_FC
 
     # Act
     success, final_translations, results = pipeline.validate_and_correct(context)
@@ -218,10 +237,7 @@ def test_multiple_checks_filtering():
         max_retries=1,
     )
 
-    pipeline = ValidationPipeline([
-        LineCountCheck(),
-        FragmentCountCheck(),
-    ])
+    pipeline = PIPE_LC_FC
 
     # Act
     success, final_translations, results = pipeline.validate_and_correct(context)
@@ -239,50 +255,6 @@ def test_multiple_checks_filtering():
     assert len(fragment_filtered) == 1, f"FragmentCountCheck a filtré 1 ligne, got {len(fragment_filtered)}"
 
 
-def test_filtered_line_metadata():
-    """
-    Test : FilteredLine contient toutes les métadonnées correctes.
-    """
-    # Arrange
-    chunk = create_mock_chunk(index=5, num_lines=5)
-
-    # original_texts = toutes les lignes attendues (0 à 4)
-    # translated_texts = seulement 0, 1, 2 (manque 3, 4)
-    original_texts = {i: f"Text {i}" for i in range(5)}
-    translated_texts = {0: "Texte 0", 1: "Texte 1", 2: "Texte 2"}  # Manque 3, 4
-
-    llm = create_mock_llm()
-
-    context = ValidationContext(
-        chunk=chunk,
-        translated_texts=translated_texts,
-        original_texts=original_texts,
-        llm=llm,
-        target_language="fr",
-        phase="initial",
-        max_retries=1,
-    )
-
-    pipeline = ValidationPipeline([LineCountCheck()])
-
-    # Act
-    success, final_translations, results = pipeline.validate_and_correct(context)
-
-    # Assert
-    assert success, "Pipeline devrait réussir avec filtrage"
-    assert len(context.filtered_lines) == 2, f"Expected 2 filtered lines, got {len(context.filtered_lines)}"
-
-    for filtered in context.filtered_lines:
-        # Vérifier tous les champs
-        assert filtered.file_name == "test.xhtml"
-        assert filtered.file_line in {"30", "40"}  # Indices 3 et 4 → 30, 40
-        assert filtered.chunk_index == 5
-        assert filtered.chunk_line in {3, 4}
-        assert filtered.check_name == "line_count"
-        assert filtered.reason == "Ligne manquante après correction"
-        assert "Line" in filtered.original_text  # Texte original présent
-
-
 def test_no_filtering_when_all_valid():
     """
     Test : Pas de filtrage si toutes les lignes sont valides.
@@ -303,11 +275,7 @@ def test_no_filtering_when_all_valid():
         max_retries=1,
     )
 
-    pipeline = ValidationPipeline([
-        LineCountCheck(),
-        FragmentCountCheck(),
-        PunctuationCheck(),
-    ])
+    pipeline = PIPE_ALL
 
     # Act
     success, final_translations, results = pipeline.validate_and_correct(context)
@@ -321,11 +289,13 @@ def test_no_filtering_when_all_valid():
 def test_filter_reason_messages():
     """
     Test : Messages de raison de filtrage sont descriptifs et corrects.
+
+    Le message de LineCountCheck est vérifié par test_line_count_filtering.
     """
-    # Test LineCountCheck
-    chunk = create_mock_chunk(index=0, num_lines=3)
-    original_texts = {0: "Text 0"}  # Manque 1, 2
-    translated_texts = {0: "Texte 0"}
+    # Test FragmentCountCheck
+    chunk = create_mock_chunk(index=1, num_lines=3)
+    original_texts = {0: "Text</>Part", 1: "Simple"}
+    translated_texts = {0: "Texte", 1: "Simple"}  # 0 manque </>
 
     context = ValidationContext(
         chunk=chunk,
@@ -337,35 +307,13 @@ def test_filter_reason_messages():
         max_retries=1,
     )
 
-    pipeline = ValidationPipeline([LineCountCheck()])
+    pipeline = PIPE_FC
     success, _, _ = pipeline.validate_and_correct(context)
 
     assert success
-    for filtered in context.filtered_lines:
-        assert "manquante" in filtered.reason.lower()
-
-    # Test FragmentCountCheck
-    chunk2 = create_mock_chunk(index=1, num_lines=3)
-    original_texts2 = {0: "Text</>Part", 1: "Simple"}
-    translated_texts2 = {0: "Texte", 1: "Simple"}  # 0 manque </>
-
-    context2 = ValidationContext(
-        chunk=chunk2,
-        translated_texts=translated_texts2,
-        original_texts=original_texts2,
-        llm=create_mock_llm(),
-        target_language="fr",
-        phase="initial",
-        max_retries=1,
-    )
-
-    pipeline2 = ValidationPipeline([FragmentCountCheck()])
-    success2, _, _ = pipeline2.validate_and_correct(context2)
-
-    assert success2
-    assert len(context2.filtered_lines) == 1
-    assert "fragments" in context2.filtered_lines[0].reason.lower()
-    assert "attendu" in context2.filtered_lines[0].reason.lower()
+    assert len(context.filtered_lines) == 1
+    assert "fragments" in context.filtered_lines[0].reason.lower()
+    assert "attendu" in context.filtered_lines[0].reason.lower()
 
 
 if __name__ == "__main__":
@@ -21,12 +21,12 @@ def validate_line_count(
         expected_count = count_expected_lines(source_content)
 
     actual = len(translations)
-    expected_indices = set(range(expected_count))  # type: ignore
-    actual_indices = set(translations.keys())
-
     if expected_count == actual:
         return True, None
 
+    expected_indices = set(range(expected_count))  # type: ignore
+    actual_indices = set(translations)
+
     # Construire message d'erreur détaillé
     missing = sorted(expected_indices - actual_indices)
     extra = sorted(actual_indices - expected_indices)
@@ -51,37 +51,31 @@ def validate_line_count(
 class TestCountExpectedLines:
     """Tests pour count_expected_lines()."""
 
-    def test_simple_content(self):
-        """Test avec contenu simple."""
-        content = "<0/>Hello\n<1/>World\n<2/>!"
-        assert count_expected_lines(content) == 3
-
-    def test_with_context_lines(self):
-        """Test avec lignes de contexte (sans <N/>)."""
-        content = """<0/>First line
-Context line without tag
-<1/>Second line
-More context
-<2/>Third line"""
-        assert count_expected_lines(content) == 3
-
-    def test_non_sequential_indices(self):
-        """Test avec indices non séquentiels."""
-        content = "<5/>Line 5\n<10/>Line 10\n<25/>Line 25"
-        assert count_expected_lines(content) == 3
-
-    def test_empty_content(self):
-        """Test avec contenu vide."""
-        assert count_expected_lines("") == 0
-
-    def test_multiline_text(self):
-        """Test avec texte multiligne après balise."""
-        content = """<0/>First line
-with continuation
-<1/>Second line
-also multiline
-<2/>Third"""
-        assert count_expected_lines(content) == 3
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            pytest.param("<0/>Hello\n<1/>World\n<2/>!", 3, id="simple"),
+            pytest.param(
+                "<0/>First line\nContext line without tag\n<1/>Second line\n"
+                "More context\n<2/>Third line",
+                3,
+                id="lignes-de-contexte",
+            ),
+            pytest.param(
+                "<5/>Line 5\n<10/>Line 10\n<25/>Line 25", 3, id="indices-non-sequentiels"
+            ),
+            pytest.param("", 0, id="vide"),
+            pytest.param(
+                "<0/>First line\nwith continuation\n<1/>Second line\n"
+                "also multiline\n<2/>Third",
+                3,
+                id="texte-multiligne",
+            ),
+        ],
+    )
+    def test_count(self, content: str, expected: int):
+        """Compte les balises <N/> en ignorant les lignes de contexte."""
+        assert count_expected_lines(content) == expected
 
 
 class TestValidateLineCount:
@@ -140,45 +134,67 @@ class TestValidateLineCount:
             validate_line_count(translations)
 
 
+def make_source(total: int) -> str:
+    """Source balisée de `total` lignes."""
+    return "\n".join(f"<{i}/>Line {i}" for i in range(total))
+
+
+def make_output(produced: range | tuple[int, ...]) -> str:
+    """Sortie LLM simulée ne contenant que les indices `produced`."""
+    return "\n".join(f"<{i}/>Ligne {i}" for i in produced) + "\n[=[END]=]"
+
+
+def count_kwargs(total: int, from_source: bool) -> dict:
+    """Arguments de validate_line_count : nombre explicite ou source balisée."""
+    if from_source:
+        return {"source_content": make_source(total)}
+    return {"expected_count": total}
+
+
 class TestIntegrationWithParser:
     """Tests d'intégration avec parse_llm_translation_output."""
 
-    def test_complete_output(self):
+    @pytest.mark.parametrize(
+        "from_source",
+        [
+            pytest.param(False, id="expected_count"),
+            pytest.param(True, id="source_content"),
+        ],
+    )
+    def test_complete_output(self, from_source: bool):
         """Test avec sortie LLM complète."""
-        output = """<0/>Première ligne
-<1/>Deuxième ligne
-<2/>Troisième ligne
-[=[END]=]"""
-        translations = parse_llm_translation_output(output)
-        is_valid, error = validate_line_count(translations, expected_count=3)
+        translations = parse_llm_translation_output(make_output(range(3)))
+        is_valid, error = validate_line_count(
+            translations, **count_kwargs(3, from_source)
+        )
+
         assert is_valid is True
+        assert error is None
 
-    def test_incomplete_output(self):
+    @pytest.mark.parametrize(
+        ("total", "produced", "from_source", "missing_marker"),
+        [
+            pytest.param(3, (0, 2), False, "<1/>", id="ligne-manquante"),
+            # Cas réel : LLM qui ignore les lignes 17-46 (copyright, etc.)
+            pytest.param(47, range(17), True, "<17/>", id="metadonnees-ignorees"),
+        ],
+    )
+    def test_incomplete_output(
+        self,
+        total: int,
+        produced: range | tuple[int, ...],
+        from_source: bool,
+        missing_marker: str,
+    ):
         """Test avec sortie LLM incomplète (lignes manquantes)."""
-        output = """<0/>Première ligne
-<2/>Troisième ligne
-[=[END]=]"""
-        translations = parse_llm_translation_output(output)
-        is_valid, error = validate_line_count(translations, expected_count=3)
-        assert is_valid is False
-        assert "<1/>" in error
-
-    def test_with_metadata_lines(self):
-        """Test simulant le cas réel : LLM qui ignore les métadonnées."""
-        # Source avec 47 lignes (0-46) incluant copyright
-        source = "\n".join([f"<{i}/>Line {i}" for i in range(47)])
-
-        # LLM qui ignore les lignes 17-46 (copyright, etc.)
-        output = "\n".join([f"<{i}/>Ligne {i}" for i in range(17)])
-        output += "\n[=[END]=]"
-
-        translations = parse_llm_translation_output(output)
+        translations = parse_llm_translation_output(make_output(produced))
         is_valid, error = validate_line_count(
-            translations, source_content=source
+            translations, **count_kwargs(total, from_source)
         )
 
         assert is_valid is False
-        assert "Attendu: 47 lignes" in error
-        assert "Reçu: 17 lignes" in error
+        assert error is not None
+        assert f"Attendu: {total} lignes" in error
+        assert f"Reçu: {len(produced)} lignes" in error
         # Vérifier que les lignes manquantes sont mentionnées
-        assert "<17/>" in error or "manquantes" in error
+        assert missing_marker in error
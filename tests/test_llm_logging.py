@@ -3,6 +3,7 @@ Tests d'intégration pour le logging des requêtes LLM.
 """
 
 import pytest
+from dataclasses import dataclass
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -10,6 +11,30 @@ from src.ebook_translator.llm import LLM
 from src.ebook_translator.logger import LogSession, get_session_log_path
 
 
+# Réponses factices : simples objets à slots plutôt qu'un arbre de MagicMock
+@dataclass(frozen=True, slots=True)
+class _Msg:
+    content: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Choice:
+    message: _Msg
+
+
+@dataclass(frozen=True, slots=True)
+class _FakeResponse:
+    choices: list[_Choice]
+
+
+def _fake_response(content: str) -> _FakeResponse:
+    """Construit une réponse de completion minimale contenant `content`."""
+    return _FakeResponse(choices=[_Choice(message=_Msg(content=content))])
+
+
+_RESP = _fake_response("Mocked translation")
+
+
 @pytest.fixture(autouse=True)
 def reset_log_session():
     """Reset la session de logs entre chaque test."""
@@ -18,23 +43,32 @@ def reset_log_session():
     LogSession.reset()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_openai_client():
-    """Mock du client OpenAI pour éviter les appels réels."""
-    with patch("src.ebook_translator.llm.OpenAI") as mock:
-        # Créer un mock de completion
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Mocked translation"
-
-        # Configurer le mock pour retourner la réponse
+    """
+    Mock du client OpenAI pour éviter les appels réels.
+
+    Construit une seule fois par module ; l'état par test est remis à zéro
+    par `reset_openai_mock`.
+    """
+    with patch("src.ebook_translator.llm.llm.OpenAI") as mock:
+        # Configurer le mock pour retourner la réponse factice partagée
         mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = _RESP
         mock.return_value = mock_client
 
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def reset_openai_mock(mock_openai_client):
+    """Efface les appels et side_effect posés par un test sur le mock partagé."""
+    yield
+    create = mock_openai_client.return_value.chat.completions.create
+    create.side_effect = None
+    mock_openai_client.reset_mock()
+
+
 @pytest.fixture
 def llm_instance(mock_openai_client):
     """Crée une instance LLM avec un client mocké."""
@@ -153,11 +187,8 @@ def test_llm_log_only_created_on_response(llm_instance, mock_openai_client):
 
 def test_llm_context_formats():
     """Test différents formats de contexte."""
-    with patch("src.ebook_translator.llm.OpenAI") as mock:
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "OK"
-        mock.return_value.chat.completions.create.return_value = mock_response
+    with patch("src.ebook_translator.llm.llm.OpenAI") as mock:
+        mock.return_value.chat.completions.create.return_value = _fake_response("OK")
 
         llm = LLM("test", "https://test.com", api_key="test")
 
@@ -2,10 +2,10 @@
 Tests pour le système de logging avec sessions et création lazy.
 """
 
+import logging
+
 import pytest
 from pathlib import Path
-import shutil
-import tempfile
 
 from src.ebook_translator.logger import (
     LogSession,
@@ -24,17 +24,6 @@ def reset_log_session():
     LogSession.reset()
 
 
-@pytest.fixture
-def temp_logs_dir(monkeypatch):
-    """Crée un répertoire temporaire pour les logs."""
-    temp_dir = tempfile.mkdtemp()
-    # Rediriger le répertoire de session vers temp
-    monkeypatch.setattr(Path, "mkdir", lambda self, **kwargs: Path(temp_dir).mkdir(**kwargs))
-    yield Path(temp_dir)
-    # Nettoyer
-    shutil.rmtree(temp_dir, ignore_errors=True)
-
-
 def test_log_session_singleton():
     """Test que LogSession est bien un singleton."""
     session1 = LogSession()
@@ -50,15 +39,10 @@ def test_log_session_creates_unique_dir():
     assert session_dir.parent == Path("logs")
 
 
-def test_lazy_file_handler_creates_file_only_on_emit():
+def test_lazy_file_handler_creates_file_only_on_emit(tmp_path: Path):
     """Test que LazyFileHandler ne crée le fichier qu'au premier log."""
-    import logging
-    import tempfile
-
-    # Créer un fichier temporaire (path uniquement)
-    temp_file = Path(tempfile.gettempdir()) / "test_lazy.log"
-    if temp_file.exists():
-        temp_file.unlink()
+    # Chemin dans le répertoire temporaire du test (pas de fichier résiduel)
+    temp_file = tmp_path / "test_lazy.log"
 
     # Créer le handler
     handler = LazyFileHandler(temp_file, mode="w")
@@ -88,9 +72,7 @@ def test_lazy_file_handler_creates_file_only_on_emit():
         content = f.read()
         assert "Test message" in content
 
-    # Nettoyer
     handler.close()
-    temp_file.unlink()
 
 
 def test_setup_logger_uses_session_dir():
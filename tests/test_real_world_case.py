@@ -6,11 +6,38 @@ autour des balises imbriquées.
 """
 
 import pytest
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from ebook_translator.htmlpage.replacement import TextReplacer
 from ebook_translator.htmlpage.bilingual import BilingualFormat
 
 
+# Les tests n'inspectent que le paragraphe (et ses <b>/<em>/<strong> imbriqués) :
+# inutile de construire <html>/<body> autour.
+PARAGRAPH_ONLY = SoupStrainer(["p", "b", "em", "strong"])
+
+USER_REPORTED_HTML = """
+    <html>
+    <body>
+        <p class="noindent">first balise<b>Restructure Clothing Spell <em>can be used</em> to redesign this outfit.</b></p>
+    </body>
+    </html>
+    """
+
+NESTED_LEVELS_HTML = """
+    <html>
+    <body>
+        <p><b>Text with <em>emphasis and <strong>strong</strong> text</em> here</b></p>
+    </body>
+    </html>
+    """
+
+
+def css_classes(tag) -> list[str]:
+    """Classes CSS d'une balise (le replacer pose "class" sous forme de chaîne)."""
+    value = tag.get("class") or []
+    return value.split() if isinstance(value, str) else list(value)
+
+
 def test_user_reported_case():
     """
     Test du cas exact rapporté :
@@ -20,15 +47,7 @@ def test_user_reported_case():
     - Balise originale stylée en gris
     - Balise traduite avec espaces corrects : "Sort de Restructuration Vestimentaire <em>peut être utilisé</em> pour redessiner cette tenue."
     """
-    html = """
-    <html>
-    <body>
-        <p class="noindent">first balise<b>Restructure Clothing Spell <em>can be used</em> to redesign this outfit.</b></p>
-    </body>
-    </html>
-    """
-
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(USER_REPORTED_HTML, "html.parser", parse_only=PARAGRAPH_ONLY)
     replacer = TextReplacer(soup)
 
     # Trouver la balise <b>
@@ -47,18 +66,20 @@ def test_user_reported_case():
 
     replacer.create_translation_tag_after(original_b_tag, translated_text)
 
-    # Récupérer le résultat final
-    result_html = str(soup)
-
     # Vérifications
 
+    # Indexer les <b> par classe en un seul parcours de l'arbre
+    b_by_class = {
+        css_class: b for b in soup.find_all("b") for css_class in css_classes(b)
+    }
+
     # 1. La balise originale <b> doit avoir la classe "original" et le style gris
-    original_tag = soup.find("b", class_="original")
+    original_tag = b_by_class.get("original")
     assert original_tag is not None
     assert original_tag.get("style") == "color: #9ca3af;"
 
     # 2. La balise de traduction doit exister avec la classe "translation"
-    translation_tag = soup.find("b", class_="translation")
+    translation_tag = b_by_class.get("translation")
     assert translation_tag is not None
 
     # 3. CRITQUE : Vérifier que les espaces sont présents autour de <em>
@@ -80,21 +101,10 @@ def test_user_reported_case():
     # Vérifier la structure HTML complète
     assert "<em>peut être utilisé</em>" in translation_text
 
-    print(f"\nTest reussi !")
-    print(f"HTML final :\n{result_html}")
-
 
 def test_multiple_nested_levels():
     """Test avec plusieurs niveaux d'imbrication."""
-    html = """
-    <html>
-    <body>
-        <p><b>Text with <em>emphasis and <strong>strong</strong> text</em> here</b></p>
-    </body>
-    </html>
-    """
-
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(NESTED_LEVELS_HTML, "html.parser", parse_only=PARAGRAPH_ONLY)
     replacer = TextReplacer(soup)
 
     original_b_tag = soup.find("b")
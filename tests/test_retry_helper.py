@@ -7,11 +7,15 @@ from ebook_translator.checks.base import ValidationContext
 from ebook_translator.segment import Chunk
 
 
-def create_mock_context(llm_mock: Mock | None = None) -> ValidationContext:
+# Distingue "aucun LLM fourni" (Mock par défaut) de llm_mock=None (pas de LLM)
+_UNSET = object()
+
+
+def create_mock_context(llm_mock: object = _UNSET) -> ValidationContext:
     """Crée un contexte de validation mock pour les tests."""
     chunk = Chunk(index=42)
 
-    if llm_mock is None:
+    if llm_mock is _UNSET:
         llm_mock = Mock()
 
     context = ValidationContext(
@@ -198,7 +202,6 @@ def test_retry_no_llm():
     """Erreur si LLM est None."""
     # Setup
     context = create_mock_context(llm_mock=None)
-    context.llm = None
 
     def render_prompt(use_reasoning: bool) -> str:
         return "Test prompt"
@@ -6,9 +6,10 @@ en chunks avec gestion du chevauchement (overlap).
 """
 
 import pytest
-from unittest.mock import Mock
 from ebook_translator.segment import Chunk, Segmentator
 
+from tests.helpers import FakeTagKey
+
 
 class TestChunk:
     """Tests pour la classe Chunk."""
@@ -17,9 +18,9 @@ class TestChunk:
         """Vérifie le format string d'un chunk."""
         chunk = Chunk(index=0)
 
-        # Créer des mock TagKeys
-        tag_key1 = Mock()
-        tag_key2 = Mock()
+        # Créer des TagKeys factices
+        tag_key1 = FakeTagKey()
+        tag_key2 = FakeTagKey()
 
         chunk.head = ["Context head"]
         chunk.body = {tag_key1: "Text 1", tag_key2: "Text 2"}
@@ -36,7 +37,7 @@ class TestChunk:
     def test_chunk_str_without_context(self):
         """Vérifie le format string sans head ni tail."""
         chunk = Chunk(index=0)
-        tag_key = Mock()
+        tag_key = FakeTagKey()
         chunk.body = {tag_key: "Only text"}
 
         result = str(chunk)
@@ -48,13 +49,11 @@ class TestChunk:
         """Vérifie que fetch génère les bonnes tuples."""
         chunk = Chunk(index=0)
 
-        # Créer des mocks
-        page1 = Mock()
-        page2 = Mock()
-        tag_key1 = Mock()
-        tag_key1.page = page1
-        tag_key2 = Mock()
-        tag_key2.page = page2
+        # Créer des TagKeys factices rattachées à deux pages distinctes
+        page1 = object()
+        page2 = object()
+        tag_key1 = FakeTagKey(page=page1)
+        tag_key2 = FakeTagKey(page=page2)
 
         chunk.body = {
             tag_key1: "Text 1",
@@ -72,7 +71,7 @@ class TestChunk:
         """Vérifie la représentation pour le debug."""
         chunk = Chunk(index=5)
         chunk.head = ["h1", "h2"]
-        chunk.body = {Mock(): "t1", Mock(): "t2", Mock(): "t3"}
+        chunk.body = {FakeTagKey(): "t1", FakeTagKey(): "t2", FakeTagKey(): "t3"}
         chunk.tail = ["t1"]
 
         repr_str = repr(chunk)
@@ -84,25 +83,24 @@ class TestChunk:
         assert "tail_items=1" in repr_str
 
 
+@pytest.fixture(scope="module")
+def segmentator() -> Segmentator:
+    """Segmentator sans pages (max_tokens=100), partagé par le module."""
+    return Segmentator(epub_htmls=[], max_tokens=100)
+
+
 class TestSegmentator:
     """Tests pour la classe Segmentator."""
 
-    def test_count_tokens(self):
+    def test_count_tokens(self, segmentator: Segmentator):
         """Vérifie le comptage de tokens."""
-        segmentator = Segmentator(
-            epub_htmls=[],
-            max_tokens=100,
-        )
-
         # Texte simple
         count = segmentator.count_tokens("Hello world")
         assert count > 0
         assert isinstance(count, int)
 
-    def test_count_tokens_empty_string(self):
+    def test_count_tokens_empty_string(self, segmentator: Segmentator):
         """Vérifie que le comptage d'une string vide fonctionne."""
-        segmentator = Segmentator(epub_htmls=[], max_tokens=100)
-
         count = segmentator.count_tokens("")
         assert count == 0
 
@@ -119,7 +117,7 @@ class TestSegmentator:
 
     def test_segmentator_repr(self):
         """Vérifie la représentation pour le debug."""
-        mock_htmls = [Mock(), Mock(), Mock()]
+        mock_htmls = [object(), object(), object()]
         segmentator = Segmentator(
             epub_htmls=mock_htmls,
             max_tokens=2000,
@@ -139,10 +137,8 @@ class TestSegmentator:
         # et de epub_htmls, ce qui est complexe. Test d'intégration recommandé.
         pass
 
-    def test_create_new_chunk(self):
+    def test_create_new_chunk(self, segmentator: Segmentator):
         """Vérifie la création d'un nouveau chunk vide."""
-        segmentator = Segmentator(epub_htmls=[], max_tokens=100)
-
         chunk = segmentator._create_new_chunk(index=5)
 
         assert isinstance(chunk, Chunk)
@@ -157,7 +153,7 @@ class TestSegmentator:
 
         # Chunk précédent avec du body
         prev_chunk = Chunk(index=0)
-        tag1, tag2, tag3 = Mock(), Mock(), Mock()
+        tag1, tag2, tag3 = FakeTagKey(), FakeTagKey(), FakeTagKey()
         prev_chunk.body = {
             tag1: "Text 1",  # ~2 tokens
             tag2: "Text 2",  # ~2 tokens
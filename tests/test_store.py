@@ -10,12 +10,26 @@ from pathlib import Path
 from ebook_translator.store import Store
 
 
+@pytest.fixture(scope="module")
+def store_root(tmp_path_factory) -> Path:
+    """Répertoire racine partagé par tous les tests du module."""
+    return tmp_path_factory.mktemp("stores")
+
+
+@pytest.fixture
+def store_dir(store_root: Path, request) -> Path:
+    """Sous-répertoire de cache propre à chaque test."""
+    cache_dir = store_root / request.node.name
+    cache_dir.mkdir()
+    return cache_dir
+
+
 class TestStore:
     """Tests pour la classe Store."""
 
-    def test_save_and_get(self, tmp_path):
+    def test_save_and_get(self, store_dir):
         """Test basique de sauvegarde et récupération."""
-        store = Store(cache_dir=tmp_path)
+        store = Store(cache_dir=store_dir)
 
         # Sauvegarder une traduction
         store.save("test.html", "0", "Bonjour")
@@ -25,18 +39,18 @@ class TestStore:
 
         assert result == "Bonjour"
 
-    def test_get_missing_translation(self, tmp_path):
+    def test_get_missing_translation(self, store_dir):
         """Test récupération d'une traduction inexistante."""
-        store = Store(cache_dir=tmp_path)
+        store = Store(cache_dir=store_dir)
 
         # Essayer de récupérer une traduction qui n'existe pas
         result = store.get("test.html", "999")
 
         assert result is None
 
-    def test_save_all(self, tmp_path):
+    def test_save_all(self, store_dir):
         """Test sauvegarde de plusieurs traductions en une fois."""
-        store = Store(cache_dir=tmp_path)
+        store = Store(cache_dir=store_dir)
 
         # Sauvegarder plusieurs traductions
         translations = {
@@ -51,9 +65,9 @@ class TestStore:
         assert store.get("test.html", "1") == "Monde"
         assert store.get("test.html", "2") == "Python"
 
-    def test_get_all(self, tmp_path):
+    def test_get_all(self, store_dir):
         """Test récupération de plusieurs traductions."""
-        store = Store(cache_dir=tmp_path)
+        store = Store(cache_dir=store_dir)
 
         # Sauvegarder des traductions
         store.save_all("test.html", {"0": "Un", "1": "Deux", "2": "Trois"})
@@ -66,9 +80,9 @@ class TestStore:
         assert results["2"] == "Trois"
         assert results["999"] is None  # Traduction manquante
 
-    def test_clear(self, tmp_path):
+    def test_clear(self, store_dir):
         """Test suppression du cache d'un fichier."""
-        store = Store(cache_dir=tmp_path)
+        store = Store(cache_dir=store_dir)
 
         # Sauvegarder une traduction
         store.save("test.html", "0", "Bonjour")
@@ -80,9 +94,9 @@ class TestStore:
         # Vérifier que le cache est vide
         assert store.get("test.html", "0") is None
 
-    def test_clear_all(self, tmp_path):
+    def test_clear_all(self, store_dir):
         """Test suppression de tous les caches."""
-        store = Store(cache_dir=tmp_path)
+        store = Store(cache_dir=store_dir)
 
         # Sauvegarder plusieurs fichiers
         store.save("file1.html", "0", "Un")
@@ -95,33 +109,33 @@ class TestStore:
         assert store.get("file1.html", "0") is None
         assert store.get("file2.html", "0") is None
 
-    def test_cache_file_naming(self, tmp_path):
+    def test_cache_file_naming(self, store_dir):
         """Test que les fichiers de cache sont créés avec le bon nom."""
-        store = Store(cache_dir=tmp_path)
+        store = Store(cache_dir=store_dir)
 
         # Sauvegarder une traduction
         store.save("path/to/test.html", "0", "Test")
 
         # Vérifier qu'un fichier de cache a été créé
-        cache_files = list(tmp_path.glob("*.json"))
+        cache_files = [p for p in store_dir.iterdir() if p.suffix == ".json"]
         assert len(cache_files) == 1
         assert "path_to_test.html" in cache_files[0].name
 
-    def test_persistence(self, tmp_path):
+    def test_persistence(self, store_dir):
         """Test que les traductions sont persistées entre instances."""
         # Première instance : sauvegarder
-        store1 = Store(cache_dir=tmp_path)
+        store1 = Store(cache_dir=store_dir)
         store1.save("test.html", "0", "Persisté")
 
         # Deuxième instance : récupérer
-        store2 = Store(cache_dir=tmp_path)
+        store2 = Store(cache_dir=store_dir)
         result = store2.get("test.html", "0")
 
         assert result == "Persisté"
 
-    def test_corrupted_cache_handling(self, tmp_path):
+    def test_corrupted_cache_handling(self, store_dir):
         """Test que le cache corrompu est géré correctement."""
-        store = Store(cache_dir=tmp_path)
+        store = Store(cache_dir=store_dir)
 
         # Créer un fichier de cache corrompu
         cache_file = store._get_cache_file("test.html")
@@ -133,5 +147,5 @@ class TestStore:
         assert result is None
 
         # Vérifier qu'une backup a été créée
-        backup_files = list(tmp_path.glob("*.backup"))
+        backup_files = [p for p in store_dir.iterdir() if p.suffix == ".backup"]
         assert len(backup_files) == 1
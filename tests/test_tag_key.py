@@ -7,76 +7,78 @@ utilisées pour identifier les fragments de texte.
 
 import pytest
 from bs4 import BeautifulSoup
-from unittest.mock import Mock
+from types import SimpleNamespace
 from ebook_translator.htmlpage.tag_key import TagKey
 
 
+# TagKey ne modifie jamais le tag : les arbres parsés peuvent être partagés.
+@pytest.fixture(scope="module")
+def p_tag():
+    """Unique balise <p> parsée une seule fois pour le module."""
+    return BeautifulSoup("<p>Test</p>", "html.parser").find("p")
+
+
+@pytest.fixture(scope="module")
+def twin_p_tags():
+    """Deux balises <p> de même contenu mais objets distincts."""
+    return BeautifulSoup("<p>Test</p><p>Test</p>", "html.parser").find_all("p")
+
+
 class TestTagKey:
     """Tests pour la classe TagKey."""
 
-    def test_index_is_always_string(self):
+    def test_index_is_always_string(self, p_tag):
         """Vérifie que l'index est toujours converti en string."""
-        soup = BeautifulSoup("<p>Test</p>", "html.parser")
-        tag = soup.find("p")
-        page = Mock()
+        page = SimpleNamespace()
 
         # Passer un int
-        key = TagKey(index=42, tag=tag, page=page)
+        key = TagKey(index=42, tag=p_tag, page=page)
 
         # Vérifier que c'est stocké comme string
         assert isinstance(key.index, str)
         assert key.index == "42"
 
-    def test_tag_key_equality_by_identity(self):
+    def test_tag_key_equality_by_identity(self, twin_p_tags):
         """Vérifie que deux TagKey sont égaux seulement si même objet Tag."""
-        soup = BeautifulSoup("<p>Test</p><p>Test</p>", "html.parser")
-        tags = soup.find_all("p")
-        page = Mock()
+        page = SimpleNamespace()
 
         # Deux tags avec le même contenu mais des objets différents
-        key1 = TagKey(index=0, tag=tags[0], page=page)
-        key2 = TagKey(index=0, tag=tags[1], page=page)
+        key1 = TagKey(index=0, tag=twin_p_tags[0], page=page)
+        key2 = TagKey(index=0, tag=twin_p_tags[1], page=page)
 
         # Ne doivent PAS être égaux (différents objets)
         assert key1 != key2
 
         # Même tag, doit être égal
-        key3 = TagKey(index=0, tag=tags[0], page=page)
+        key3 = TagKey(index=0, tag=twin_p_tags[0], page=page)
         assert key1 == key3
 
-    def test_tag_key_hashable(self):
+    def test_tag_key_hashable(self, p_tag):
         """Vérifie que TagKey peut être utilisé comme clé de dictionnaire."""
-        soup = BeautifulSoup("<p>Test</p>", "html.parser")
-        tag = soup.find("p")
-        page = Mock()
+        page = SimpleNamespace()
 
-        key = TagKey(index=0, tag=tag, page=page)
+        key = TagKey(index=0, tag=p_tag, page=page)
 
         # Doit pouvoir être utilisé comme clé
         test_dict = {key: "valeur"}
         assert test_dict[key] == "valeur"
 
-    def test_tag_key_hash_stability(self):
+    def test_tag_key_hash_stability(self, p_tag):
         """Vérifie que le hash d'un TagKey reste constant."""
-        soup = BeautifulSoup("<p>Test</p>", "html.parser")
-        tag = soup.find("p")
-        page = Mock()
+        page = SimpleNamespace()
 
-        key = TagKey(index=0, tag=tag, page=page)
+        key = TagKey(index=0, tag=p_tag, page=page)
 
         # Le hash doit rester le même
         hash1 = hash(key)
         hash2 = hash(key)
         assert hash1 == hash2
 
-    def test_tag_key_repr(self):
+    def test_tag_key_repr(self, p_tag):
         """Vérifie la représentation string pour le debug."""
-        soup = BeautifulSoup("<p>Test</p>", "html.parser")
-        tag = soup.find("p")
-        page = Mock()
-        page.epub_html.file_name = "test.html"
+        page = SimpleNamespace(epub_html=SimpleNamespace(file_name="test.html"))
 
-        key = TagKey(index=5, tag=tag, page=page)
+        key = TagKey(index=5, tag=p_tag, page=page)
 
         repr_str = repr(key)
         assert "TagKey" in repr_str
@@ -84,27 +86,23 @@ class TestTagKey:
         assert "tag=p" in repr_str
         assert "test.html" in repr_str
 
-    def test_different_indices_same_tag(self):
+    def test_different_indices_same_tag(self, p_tag):
         """Vérifie que différents indices avec même tag sont égaux (identité du tag)."""
-        soup = BeautifulSoup("<p>Test</p>", "html.parser")
-        tag = soup.find("p")
-        page = Mock()
+        page = SimpleNamespace()
 
         # Même tag, indices différents
-        key1 = TagKey(index=0, tag=tag, page=page)
-        key2 = TagKey(index=999, tag=tag, page=page)
+        key1 = TagKey(index=0, tag=p_tag, page=page)
+        key2 = TagKey(index=999, tag=p_tag, page=page)
 
         # Doivent être égaux car même objet tag (identité)
         assert key1 == key2
         # Mais les index sont différents
         assert key1.index != key2.index
 
-    def test_tag_key_stores_page_reference(self):
+    def test_tag_key_stores_page_reference(self, p_tag):
         """Vérifie que TagKey conserve la référence à la page."""
-        soup = BeautifulSoup("<p>Test</p>", "html.parser")
-        tag = soup.find("p")
-        page = Mock()
+        page = SimpleNamespace()
 
-        key = TagKey(index=0, tag=tag, page=page)
+        key = TagKey(index=0, tag=p_tag, page=page)
 
         assert key.page is page
@@ -10,7 +10,6 @@ Ces tests vérifient :
 
 import pytest
 from pathlib import Path
-import tempfile
 
 from ebook_translator.quality import (
     UntranslatedDetector,
@@ -20,13 +19,17 @@ from ebook_translator.quality import (
 from ebook_translator.glossary import Glossary
 
 
+@pytest.fixture(scope="module")
+def detector() -> UntranslatedDetector:
+    """Détecteur en → fr partagé (sans état : ne garde que les langues)."""
+    return UntranslatedDetector(source_lang="en", target_lang="fr")
+
+
 class TestUntranslatedDetector:
     """Tests pour le détecteur de segments non traduits."""
 
-    def test_detect_english_sentence(self):
+    def test_detect_english_sentence(self, detector: UntranslatedDetector):
         """Vérifie la détection d'une phrase en anglais."""
-        detector = UntranslatedDetector(source_lang="en", target_lang="fr")
-
         # Phrase clairement en anglais
         text = "The cat is sleeping on the couch."
         issues = detector.detect(text, min_confidence=0.6)
@@ -34,10 +37,8 @@ class TestUntranslatedDetector:
         assert len(issues) > 0
         assert issues[0].confidence >= 0.6
 
-    def test_no_false_positive_on_french(self):
+    def test_no_false_positive_on_french(self, detector: UntranslatedDetector):
         """Vérifie qu'on ne détecte pas le français comme anglais."""
-        detector = UntranslatedDetector(source_lang="en", target_lang="fr")
-
         # Phrase en français
         text = "Le chat dort sur le canapé."
         issues = detector.detect(text, min_confidence=0.6)
@@ -45,10 +46,8 @@ class TestUntranslatedDetector:
         # Ne devrait pas détecter (ou très faible confiance)
         assert len(issues) == 0 or issues[0].confidence < 0.3
 
-    def test_detect_identical_translation(self):
+    def test_detect_identical_translation(self, detector: UntranslatedDetector):
         """Vérifie la détection de traduction identique."""
-        detector = UntranslatedDetector(source_lang="en", target_lang="fr")
-
         original = "Hello world"
         translated = "Hello world"  # Identique !
 
@@ -58,10 +57,8 @@ class TestUntranslatedDetector:
         assert issue.confidence == 1.0
         assert "identique" in issue.reason.lower()
 
-    def test_accept_legitimate_translation(self):
+    def test_accept_legitimate_translation(self, detector: UntranslatedDetector):
         """Vérifie qu'une vraie traduction n'est pas signalée."""
-        detector = UntranslatedDetector(source_lang="en", target_lang="fr")
-
         original = "Hello world"
         translated = "Bonjour le monde"
 
@@ -78,9 +75,11 @@ class TestTerminologyChecker:
         checker = TerminologyChecker()
 
         # Même terme, traductions différentes
-        checker.add_pair("Matrix", "Matrice", position=0)
-        checker.add_pair("Matrix", "Matrice", position=1)
-        checker.add_pair("Matrix", "Système", position=2)
+        checker.add_pairs([
+            ("Matrix", "Matrice", 0),
+            ("Matrix", "Matrice", 1),
+            ("Matrix", "Système", 2),
+        ])
 
         issues = checker.get_issues()
 
@@ -94,9 +93,11 @@ class TestTerminologyChecker:
         checker = TerminologyChecker()
 
         # Toujours la même traduction
-        checker.add_pair("Matrix", "Matrice", position=0)
-        checker.add_pair("Matrix", "Matrice", position=1)
-        checker.add_pair("Matrix", "Matrice", position=2)
+        checker.add_pairs([
+            ("Matrix", "Matrice", 0),
+            ("Matrix", "Matrice", 1),
+            ("Matrix", "Matrice", 2),
+        ])
 
         issues = checker.get_issues()
 
@@ -117,9 +118,11 @@ class TestTerminologyChecker:
         """Vérifie la génération de glossaire."""
         checker = TerminologyChecker()
 
-        checker.add_pair("Matrix", "Matrice", position=0)
-        checker.add_pair("Matrix", "Matrice", position=1)
-        checker.add_pair("Sakamoto", "Sakamoto", position=0)
+        checker.add_pairs([
+            ("Matrix", "Matrice", 0),
+            ("Matrix", "Matrice", 1),
+            ("Sakamoto", "Sakamoto", 0),
+        ])
 
         glossary = checker.get_glossary()
 
@@ -188,22 +191,21 @@ class TestGlossary:
         translation = glossary.get_translation("Matrix")
         assert translation == "Matrice"
 
-    def test_save_and_load(self):
+    def test_save_and_load(self, tmp_path: Path):
         """Vérifie la sauvegarde et le chargement."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "glossary.json"
+        path = tmp_path / "glossary.json"
 
-            # Créer et sauvegarder
-            glossary1 = Glossary(cache_path=path)
-            glossary1.learn("Matrix", "Matrice")
-            glossary1.validate_translation("Sakamoto", "Sakamoto")
-            glossary1.save()
+        # Créer et sauvegarder
+        glossary1 = Glossary(cache_path=path)
+        glossary1.learn("Matrix", "Matrice")
+        glossary1.validate_translation("Sakamoto", "Sakamoto")
+        glossary1.save()
 
-            # Charger dans une nouvelle instance
-            glossary2 = Glossary(cache_path=path)
+        # Charger dans une nouvelle instance
+        glossary2 = Glossary(cache_path=path)
 
-            assert glossary2.get_translation("Matrix") == "Matrice"
-            assert glossary2.get_translation("Sakamoto") == "Sakamoto"
+        assert glossary2.get_translation("Matrix") == "Matrice"
+        assert glossary2.get_translation("Sakamoto") == "Sakamoto"
 
 
 class TestQualityValidator:
@@ -275,10 +277,39 @@ class TestQualityValidator:
         # Le glossaire peut être vide ou contenir des termes selon l'extraction
         # (dépend de l'extraction de noms propres)
 
+    def test_validate_batch_matches_validate_translation(self):
+        """Vérifie que validate_batch() équivaut à validate_translation() paire par paire."""
+        pairs = [
+            ("The Matrix is active.", "La Matrice est active.", 0),
+            ("Hello world", "Hello world", 1),  # Identique !
+            ("Dr. Sakamoto arrived.", "Le Dr Sakamoto arriva.", 2),
+        ]
+
+        batch_validator = QualityValidator(source_lang="en", target_lang="fr")
+        results = batch_validator.validate_batch(pairs)
+
+        single_validator = QualityValidator(source_lang="en", target_lang="fr")
+        expected = [
+            single_validator.validate_translation(orig, trans, position=pos)
+            for orig, trans, pos in pairs
+        ]
+
+        # Un résultat par paire, dans l'ordre d'entrée
+        assert results == expected == [True, False, True]
+        assert batch_validator.untranslated_count == single_validator.untranslated_count
+
+    def test_validate_batch_empty(self):
+        """Vérifie qu'un lot vide ne valide rien."""
+        validator = QualityValidator(source_lang="en", target_lang="fr")
+
+        assert validator.validate_batch([]) == []
+        assert validator.untranslated_count == 0
+
 
 class TestIntegration:
     """Tests d'intégration du système de validation."""
 
+    @pytest.mark.slow
     def test_full_workflow(self):
         """Test du workflow complet de validation."""
         validator = QualityValidator(
@@ -291,13 +322,13 @@ class TestIntegration:
 
         # Simuler plusieurs traductions
         translations = [
-            ("Dr. Sakamoto activated the Matrix.", "Le Dr Sakamoto activa la Matrice."),
-            ("The Matrix hummed to life.", "La Matrice s'anima en ronronnant."),
-            ("Matrix power levels stable.", "Niveaux de puissance de la Matrice stables."),
+            ("Dr. Sakamoto activated the Matrix.", "Le Dr Sakamoto activa la Matrice.", 0),
+            ("The Matrix hummed to life.", "La Matrice s'anima en ronronnant.", 1),
+            ("Matrix power levels stable.", "Niveaux de puissance de la Matrice stables.", 2),
         ]
 
-        for i, (orig, trans) in enumerate(translations):
-            validator.validate_translation(orig, trans, position=i)
+        results = validator.validate_batch(translations)
+        assert len(results) == len(translations)
 
         # Vérifier le rapport
         report = validator.generate_report()
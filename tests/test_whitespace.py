@@ -7,6 +7,9 @@ préservés lors de l'extraction et du remplacement de texte.
 
 import pytest
 from bs4 import BeautifulSoup
+from bs4.element import NavigableString
+from ebooklib import epub
+from ebook_translator.htmlpage.page import HtmlPage
 from ebook_translator.htmlpage.replacement import preserve_whitespace, TextReplacer
 from ebook_translator.htmlpage.bilingual import BilingualFormat
 
@@ -14,50 +17,32 @@ from ebook_translator.htmlpage.bilingual import BilingualFormat
 class TestPreserveWhitespace:
     """Tests pour la fonction preserve_whitespace()."""
 
-    def test_no_whitespace(self):
-        """Texte sans espaces de bordure."""
-        result = preserve_whitespace("text", "texte")
-        assert result == "texte"
-
-    def test_leading_whitespace(self):
-        """Texte avec espace au début."""
-        result = preserve_whitespace(" text", "texte")
-        assert result == " texte"
-
-    def test_trailing_whitespace(self):
-        """Texte avec espace à la fin."""
-        result = preserve_whitespace("text ", "texte")
-        assert result == "texte "
-
-    def test_both_whitespace(self):
-        """Texte avec espaces des deux côtés."""
-        result = preserve_whitespace(" text ", "texte")
-        assert result == " texte "
-
-    def test_multiple_leading_spaces(self):
-        """Plusieurs espaces au début (doit normaliser à 1)."""
-        result = preserve_whitespace("   text", "texte")
-        assert result == " texte"
-
-    def test_multiple_trailing_spaces(self):
-        """Plusieurs espaces à la fin (doit normaliser à 1)."""
-        result = preserve_whitespace("text   ", "texte")
-        assert result == "texte "
-
-    def test_translated_already_has_spaces(self):
-        """La traduction a déjà des espaces (ne pas dupliquer)."""
-        result = preserve_whitespace(" text ", " texte ")
-        assert result == " texte "
-
-    def test_empty_original(self):
-        """Texte original vide."""
-        result = preserve_whitespace("", "texte")
-        assert result == "texte"
-
-    def test_newline_as_whitespace(self):
-        """Newline compte comme espace."""
-        result = preserve_whitespace("\ntext", "texte")
-        assert result == " texte"
+    @pytest.mark.parametrize(
+        ("original", "translated", "expected"),
+        [
+            # Texte sans espaces de bordure
+            pytest.param("text", "texte", "texte", id="no_whitespace"),
+            # Texte avec espace au début
+            pytest.param(" text", "texte", " texte", id="leading_whitespace"),
+            # Texte avec espace à la fin
+            pytest.param("text ", "texte", "texte ", id="trailing_whitespace"),
+            # Texte avec espaces des deux côtés
+            pytest.param(" text ", "texte", " texte ", id="both_whitespace"),
+            # Plusieurs espaces au début (doit normaliser à 1)
+            pytest.param("   text", "texte", " texte", id="multiple_leading_spaces"),
+            # Plusieurs espaces à la fin (doit normaliser à 1)
+            pytest.param("text   ", "texte", "texte ", id="multiple_trailing_spaces"),
+            # La traduction a déjà des espaces (ne pas dupliquer)
+            pytest.param(" text ", " texte ", " texte ", id="translated_already_has_spaces"),
+            # Texte original vide
+            pytest.param("", "texte", "texte", id="empty_original"),
+            # Newline compte comme espace
+            pytest.param("\ntext", "texte", " texte", id="newline_as_whitespace"),
+        ],
+    )
+    def test_preserve_whitespace(self, original: str, translated: str, expected: str):
+        """Les espaces de bordure de l'original sont reportés sur la traduction."""
+        assert preserve_whitespace(original, translated) == expected
 
 
 class TestHtmlReconstructionWithWhitespace:
@@ -129,38 +114,27 @@ class TestHtmlReconstructionWithWhitespace:
         assert len(text_fragments) == 3  # "début", " ", "fin"
 
 
+@pytest.fixture(scope="module")
+def page() -> HtmlPage:
+    """HtmlPage minimale partagée (_format_text ne dépend pas du contenu)."""
+    epub_html = epub.EpubHtml(title="test", file_name="test.xhtml")
+    epub_html.content = b"<html><body><p> text</p></body></html>"
+    return HtmlPage(epub_html)
+
+
 class TestFormatTextPreservesWhitespace:
     """Tests pour _format_text() qui doit préserver les espaces."""
 
-    def test_format_single_fragment_with_leading_space(self):
+    def test_format_single_fragment_with_leading_space(self, page: HtmlPage):
         """Fragment unique avec espace au début."""
-        from bs4.element import NavigableString
-        from ebook_translator.htmlpage.page import HtmlPage
-        from ebooklib import epub
-
-        # Créer un EpubHtml minimal
-        epub_html = epub.EpubHtml(title="test", file_name="test.xhtml")
-        epub_html.content = b"<html><body><p> text</p></body></html>"
-
-        page = HtmlPage(epub_html)
-
         # Tester _format_text directement
         fragment = NavigableString(" text")
         result = page._format_text(fragment)
 
         assert result == " text"
 
-    def test_format_multiple_fragments_with_spaces(self):
+    def test_format_multiple_fragments_with_spaces(self, page: HtmlPage):
         """Multiples fragments avec espaces de bordure."""
-        from bs4.element import NavigableString
-        from ebook_translator.htmlpage.page import HtmlPage
-        from ebooklib import epub
-
-        epub_html = epub.EpubHtml(title="test", file_name="test.xhtml")
-        epub_html.content = b"<html><body></body></html>"
-
-        page = HtmlPage(epub_html)
-
         fragments = [
             NavigableString("start "),
             NavigableString(" middle "),